@@ -1,8 +1,26 @@
-"""Streamlit web application for Black-Box Functional Testing."""
+"""Streamlit web application for Black-Box Functional Testing.
+
+Optional: ``pip install winloop`` (Windows) or ``pip install uvloop`` (Linux/macOS)
+for a faster libuv-based asyncio event loop.
+"""
 
 import sys
 import os
 
+# Faster libuv event loop when available; must be installed before any loop is created
+if sys.platform == 'win32':
+    try:
+        import winloop
+        winloop.install()
+    except ImportError:
+        pass
+else:
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 # CRITICAL: Set environment variable BEFORE asyncio import
 # This forces asyncio to use the correct event loop from the start
 if sys.platform == 'win32':
@@ -23,8 +41,10 @@ import asyncio
 # Windows uses ProactorEventLoop by default since Python 3.8
 # Playwright requires SelectorEventLoop for subprocess management
 if sys.platform == 'win32':
-    # Use ProactorEventLoop on Windows (supports subprocess required by Playwright)
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    # Use ProactorEventLoop on Windows (supports subprocess required by Playwright),
+    # unless winloop already installed its own policy above
+    if 'winloop' not in sys.modules:
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
     # Ensure there is a current loop without triggering deprecation warnings
     try:
@@ -39,7 +59,21 @@ from datetime import datetime
 from pathlib import Path
 import logging
 import json
+import re
+import shutil
+import multiprocessing
+import secrets
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
+import io
+import zipfile
+from functools import partial
+
+# orjson is optional; used for faster config.json / results JSON encode/decode
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging EARLY
 logging.basicConfig(
@@ -48,8 +82,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Verify event loop type on Windows
-if sys.platform == 'win32':
+@st.cache_resource(show_spinner=False)
+def _verify_event_loop():
+    """Log the Windows event loop/policy once per process (reruns would otherwise repeat it)."""
     try:
         try:
             current_loop = asyncio.get_running_loop()
@@ -59,33 +94,37 @@ if sys.platform == 'win32':
 
         loop_type = type(current_loop).__name__
         policy_type = type(asyncio.get_event_loop_policy()).__name__
-        logger.info(f"✓ Event Loop Type: {loop_type}")
-        logger.info(f"✓ Event Loop Policy: {policy_type}")
+        logger.info("✓ Event Loop Type: %s", loop_type)
+        logger.info("✓ Event Loop Policy: %s", policy_type)
 
         # Verify it's ProactorEventLoop (required for subprocess on Windows)
         from asyncio import windows_events, selector_events
-        if isinstance(current_loop, windows_events.ProactorEventLoop):
+        if 'winloop' in sys.modules:
+            logger.info("✓ Using winloop - Playwright compatible")
+        elif isinstance(current_loop, windows_events.ProactorEventLoop):
             logger.info("✓ Using ProactorEventLoop - Playwright compatible")
         elif isinstance(current_loop, selector_events.SelectorEventLoop):
             logger.error("❌ ERROR: Still using SelectorEventLoop! Subprocess will FAIL on Windows")
         else:
             logger.warning("⚠️ Unexpected event loop type on Windows")
     except Exception as e:
-        logger.warning(f"Could not verify event loop: {e}")
-
-# Add app directory to Python path
-app_dir = Path(__file__).parent
-sys.path.insert(0, str(app_dir.parent))
-
-from app.runners.crawl import crawl_site, crawl_site_with_auth
-from app.runners.playwright_runner import run_page_smoke, run_yaml_scenario
-from app.services.reporter import generate_all_reports, generate_stress_test_reports
-from app.services.yaml_loader import load_yaml_spec, create_sample_yaml
-from app.services.heuristics import test_form_submission
-from app.services.stress_test import StressTester, create_stress_test_config, run_stress_test
-from app.services.load_generator import AdvancedLoadGenerator, create_load_generator_config, run_load_test, LoadGeneratorScale
-from app.services.progress_monitor import create_progress_monitor, create_streamlit_updater
-from app.models.db import init_db, create_test_run, update_test_run, create_page_test, get_recent_runs
+        logger.warning("Could not verify event loop: %s", e)
+    return True
+
+# Verify event loop type on Windows (diagnostic only; set WUBT_DEBUG_LOOP=1 to enable)
+if sys.platform == 'win32' and os.environ.get('WUBT_DEBUG_LOOP') == '1':
+    _verify_event_loop()
+
+# Add project root to Python path (once; Streamlit re-executes this script on every rerun)
+APP_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = APP_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Runner/Playwright/reporter/YAML modules are imported lazily inside the branches that use them,
+# so opening the app (or the History/About tabs) doesn't pay their import cost.
+# The DB layer is needed on every first load (init + history tab) and stays here.
+from app.models.db import init_db, create_test_run, update_test_run, create_page_tests_bulk, get_recent_runs
 
 # Page configuration
 st.set_page_config(
@@ -95,165 +134,830 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource(show_spinner=False)
+def _get_db():
+    """Create tables/pragmas once per process rather than per session."""
+    init_db()
+    return True
+
 # Initialize database
-init_db()
+_get_db()
 
 # Configuration file path
 CONFIG_FILE = "config.json"
+# Minimum seconds between automatic config writes
+CONFIG_SAVE_INTERVAL = 2.0
+
+
+STATIC_DIR = APP_DIR / "static"
+# Published HTML report copies kept for the static-serving preview (oldest removed first)
+STATIC_REPORTS_KEEP = 20
+
+FOOTER_HTML = (
+    '<div style="text-align: center; color: #666; font-size: 0.9rem;">'
+    'Black-Box Testing Tool v1.0 | Powered by Playwright</div>'
+)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_css():
+    """App stylesheet as a ready <style> block, built once per process (shared, not copied per rerun)."""
+    # Collapse indentation/newlines so fewer bytes go over the websocket each rerun
+    css = re.sub(r"\s+", " ", (STATIC_DIR / 'styles.css').read_text(encoding='utf-8')).strip()
+    return f"<style>{css}</style>"
+
+
+@st.cache_resource(show_spinner=False)
+def _sample_yaml_path():
+    """Target path of the generated sample YAML; its folder is created once per process."""
+    sample_path = "tests/sample_specs/generated_sample.yaml"
+    os.makedirs(os.path.dirname(sample_path), exist_ok=True)
+    return sample_path
+
+
+@st.cache_resource(show_spinner=False)
+def _system_specs():
+    """(logical CPU count, total RAM in GB) of this machine, detected once per process."""
+    import psutil
+    return psutil.cpu_count(logical=True), psutil.virtual_memory().total / (1024**3)
+
+
+@st.cache_data(show_spinner=False)
+def _about_md():
+    """About tab content, read once per process."""
+    return (STATIC_DIR / "about.md").read_text(encoding="utf-8")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_crawl(base_url, max_depth, max_pages, same_origin_only, include_key: tuple, exclude_key: tuple, timeout):
+    """Crawl a site, memoized per URL + crawler config for an hour."""
+    from app.runners.crawl import crawl_site
+    return crawl_site(
+        base_url=base_url,
+        max_depth=max_depth,
+        max_pages=max_pages,
+        same_origin_only=same_origin_only,
+        include_patterns=list(include_key) or None,
+        exclude_patterns=list(exclude_key) or None,
+        timeout=timeout
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def _parse_yaml_spec(file_id, _upload):
+    """Parse an uploaded spec once per upload; re-running the same file reuses it."""
+    from app.services.yaml_loader import load_yaml_spec
+    _upload.seek(0)
+    return load_yaml_spec(_upload)
+
+
+def _simulated_performance(duration, base_rps, avg_response_time):
+    """Simulated RPS/response-time curve (~20 points) for the stress and load charts."""
+    import numpy as np
+    t = np.arange(0, int(duration), max(1, int(duration // 20)))
+    # Add some variation around the measured averages
+    variation = 0.1 * base_rps * (0.5 - (t % 10) / 10)
+    return {
+        "Time (s)": t,
+        "Requests/sec": np.maximum(0, base_rps + variation),
+        "Response Time (s)": avg_response_time * (1 + 0.1 * (t % 5) / 5),
+    }
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _recent_runs_cached(limit):
+    """Recent test runs as plain dicts; cleared whenever a run finishes."""
+    return [run.model_dump() for run in get_recent_runs(limit=limit)]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _page_tests_cached(run_id):
+    """Summary rows of one run's pages as plain dicts (full results stay on disk)."""
+    from app.models.db import get_page_tests
+    return [page.model_dump() for page in get_page_tests(run_id)]
+
+
+def _page_details(page: dict):
+    """Full result of one stored page: its result.json.gz, or the legacy result_json column."""
+    if page.get('artifact_path'):
+        from app.runners.playwright_runner import load_page_result
+        try:
+            return load_page_result(page['artifact_path'])
+        except (OSError, ValueError) as e:
+            logger.warning("Cannot read page result from %s: %s", page['artifact_path'], e)
+            return None
+    if page.get('result_json'):
+        return json.loads(page['result_json'])
+    return None
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _read_bytes(path: str, mtime: float) -> bytes:
+    """Report file contents, read once per path + file version."""
+    return Path(path).read_bytes()
+
+
+def _static_report_url(html_path: str, run_id: str) -> str:
+    """Publish the HTML report under app/static/reports and return its URL path.
+
+    Only used when ``server.enableStaticServing = true`` is set (in
+    ``.streamlit/config.toml`` or via ``--server.enableStaticServing true``);
+    without it Streamlit does not serve ``app/static`` and the caller falls
+    back to the inline preview. Only the ``STATIC_REPORTS_KEEP`` most recently
+    published copies are kept, older ones are removed here.
+    """
+    reports_dir = STATIC_DIR / "reports"
+    target = reports_dir / f"report_{run_id}.html"
+    if not target.exists():
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(html_path, target)
+    else:
+        target.touch()  # Mark as recently viewed so pruning keeps it
+    copies = sorted(reports_dir.glob("report_*.html"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in copies[STATIC_REPORTS_KEEP:]:
+        stale.unlink(missing_ok=True)
+    return f"app/static/reports/{target.name}"
+
+
+def _load_bytes(path: str) -> bytes:
+    """Report file contents for download buttons (re-read only when the file changes)."""
+    return _read_bytes(path, os.path.getmtime(path))
+
+
+def _report_bundle(report_paths: dict, run_id: str) -> bytes:
+    """Zip of every generated report; built only when the bundle download is clicked."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for kind, path in report_paths.items():
+            if path and os.path.exists(path):
+                zf.writestr(f"report_{run_id}.{kind}", _load_bytes(path))
+    return buf.getvalue()
+
+
+def _html_body(path: str) -> str:
+    """HTML report text for the inline preview (re-read only when the file changes)."""
+    # Same cached bytes as the download button, so the file is read only once
+    return _load_bytes(path).decode("utf-8")
+
+
+_TEST_MODES = ("Crawler Mode", "YAML Scenario", "Single Page", "Stress Test", "Load Generator")
+_TEST_MODE_IDX = {mode: i for i, mode in enumerate(_TEST_MODES)}
+
+# Default values of the persisted configuration
+DEFAULTS = {
+    'test_mode': "Single Page",
+    'base_url': "https://example.com",
+    'max_depth': 2,
+    'max_pages': 10,
+    'same_origin': True,
+    'include_pattern': "",
+    'exclude_pattern': "",
+    'headless': True,
+    'timeout': 10,
+    'deep_component_test': True,
+    'test_forms': False,
+    'auth_enabled': False,
+    'login_url': "",
+    'auth_username': "",
+    'auth_password': "",
+    'success_indicator': "",
+    'stress_concurrent_users': 3,  # Reduced from 10 to 3
+    'stress_duration': 30,  # Reduced from 60 to 30
+    'stress_ramp_up': 5,  # Reduced from 10 to 5
+    'stress_think_time': 2.0,  # Increased from 1.0 to 2.0 for less CPU usage
+    'stress_timeout': 15,  # Reduced from 30 to 15
+    'stress_actions': "",
+    'load_virtual_users': 10,
+    'load_duration': 60,
+    'load_ramp_up': 10,
+    'load_ramp_down': 10,
+    'load_think_time': 1.0,
+    'load_timeout': 30,
+    'load_scenario_name': "Load Test Scenario",
+    'load_test_plan': "Load Test Plan",
+    'load_max_browsers': 5,
+    'load_memory_limit': 128,
+    'load_enable_monitoring': True,
+    'load_max_cpu': 80,
+    'load_max_memory': 85,
+    'scenario_parallelism': 1,
+    'page_concurrency': 4,  # browser workers; each is a separate Chromium
+    'full_page_screenshot': False,
+    'screenshot_quality': 60
+}
+
+# Sidebar widgets whose state lives under their own key (initialised from a DEFAULTS key)
+CONFIG_WIDGET_KEYS = (
+    "crawler_base_url", "crawler_max_depth", "crawler_max_pages", "crawler_same_origin",
+    "crawler_include_pattern", "crawler_exclude_pattern", "crawler_force_recrawl",
+    "yaml_scenario_parallelism", "stress_test_url", "load_generator_url",
+    "single_page_url", "single_page_save_artifacts",
+    "test_headless", "test_page_concurrency", "test_timeout", "test_deep_component",
+    "test_full_page_screenshot", "test_screenshot_quality", "use_result_cache",
+    "enable_xss_test", "enable_sql_test", "form_safe_mode",
+    "auth_login_url", "auth_success_indicator",
+)
+
+
+def reset_config():
+    """Reset configuration (and the widgets showing it) to DEFAULTS and drop config.json."""
+    for key, value in DEFAULTS.items():
+        st.session_state[key] = value
+    st.session_state['_config_values'] = dict(DEFAULTS)
+    for key in CONFIG_WIDGET_KEYS:
+        st.session_state.pop(key, None)
+    try:
+        os.remove(CONFIG_FILE)
+    except FileNotFoundError:
+        pass
+    st.session_state.pop('_last_saved', None)
+    # Treat the defaults as freshly loaded, so the auto-save doesn't recreate the file
+    st.session_state.pop('_config_snapshot', None)
+    st.session_state['_config_dirty'] = False
+
+
+def _saved_label(last_saved) -> str:
+    """Display text for a config's last_saved (epoch seconds; older files hold an ISO string)."""
+    if isinstance(last_saved, (int, float)):
+        return datetime.fromtimestamp(last_saved).strftime("%Y-%m-%d %H:%M:%S")
+    return str(last_saved)[:19]
+
+
+def _remember_config(key, widget_key=None):
+    """on_change of a widget that edits a config key: copy its value to the persisted settings."""
+    # Streamlit forgets a widget's value when the widget isn't rendered (other mode, hidden
+    # slider), so the settings live under a key no widget owns
+    st.session_state['_config_values'][key] = st.session_state[widget_key or key]
+    # Called here too: an edit inside a sidebar fragment reruns only the fragment, not the
+    # auto-save at the end of the sidebar
+    _autosave_config()
+
 
 def save_config_to_file():
     """Save current configuration to JSON file."""
-    config = {
-        "test_mode": st.session_state.get("test_mode", "Single Page"),
-        "base_url": st.session_state.get("base_url", "https://example.com"),
-        "max_depth": st.session_state.get("max_depth", 2),
-        "max_pages": st.session_state.get("max_pages", 10),
-        "same_origin": st.session_state.get("same_origin", True),
-        "include_pattern": st.session_state.get("include_pattern", ""),
-        "exclude_pattern": st.session_state.get("exclude_pattern", ""),
-        "headless": st.session_state.get("headless", True),
-        "timeout": st.session_state.get("timeout", 10),
-        "deep_component_test": st.session_state.get("deep_component_test", True),
-        "test_forms": st.session_state.get("test_forms", False),
-        "auth_enabled": st.session_state.get("auth_enabled", False),
-        "login_url": st.session_state.get("login_url", ""),
-        "auth_username": st.session_state.get("auth_username", ""),
-        "auth_password": st.session_state.get("auth_password", ""),
-        "success_indicator": st.session_state.get("success_indicator", ""),
-        "stress_concurrent_users": st.session_state.get("stress_concurrent_users", 3),
-        "stress_duration": st.session_state.get("stress_duration", 30),
-        "stress_ramp_up": st.session_state.get("stress_ramp_up", 5),
-        "stress_think_time": st.session_state.get("stress_think_time", 2.0),
-        "stress_timeout": st.session_state.get("stress_timeout", 15),
-        "stress_actions": st.session_state.get("stress_actions", ""),
-        "load_virtual_users": st.session_state.get("load_virtual_users", 10),
-        "load_duration": st.session_state.get("load_duration", 60),
-        "load_ramp_up": st.session_state.get("load_ramp_up", 10),
-        "load_ramp_down": st.session_state.get("load_ramp_down", 10),
-        "load_think_time": st.session_state.get("load_think_time", 1.0),
-        "load_timeout": st.session_state.get("load_timeout", 30),
-        "load_scenario_name": st.session_state.get("load_scenario_name", "Load Test Scenario"),
-        "load_test_plan": st.session_state.get("load_test_plan", "Load Test Plan"),
-        "load_max_browsers": st.session_state.get("load_max_browsers", 5),
-        "load_memory_limit": st.session_state.get("load_memory_limit", 128),
-        "load_enable_monitoring": st.session_state.get("load_enable_monitoring", True),
-        "load_max_cpu": st.session_state.get("load_max_cpu", 80),
-        "load_max_memory": st.session_state.get("load_max_memory", 85),
-        "last_saved": datetime.now().isoformat()
-    }
+    config = dict(st.session_state['_config_values'])
+    config["last_saved"] = int(time.time())
     
     try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Serialize in memory, then swap the file in atomically
+        tmp_path = f"{CONFIG_FILE}.tmp"
+        # Compact output: the file is machine-written and re-read, not hand-edited
+        if orjson is not None:
+            data = orjson.dumps(config)
+        else:
+            data = json.dumps(config, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, CONFIG_FILE)
+        st.session_state['_last_saved'] = _saved_label(config['last_saved'])
+        st.session_state['_last_save_at'] = time.monotonic()
+        st.session_state['_config_dirty'] = False
+        st.session_state['_written_snapshot'] = tuple(config[key] for key in DEFAULTS)
         logger.info("Configuration saved to file")
     except Exception as e:
-        logger.error(f"Failed to save config: {e}")
+        logger.error("Failed to save config: %s", e)
+
+
+def _autosave_config(flush=False):
+    """Debounced auto-save: write config.json when the remembered settings changed."""
+    # One snapshot diff per call; widgets that own a config key update _config_values from on_change
+    config_snapshot = tuple(st.session_state['_config_values'].values())
+    
+    if config_snapshot != st.session_state.get('_config_snapshot'):
+        if '_config_snapshot' in st.session_state:
+            st.session_state['_config_dirty'] = True
+        else:
+            # The first run of a session only records the loaded values (= what's on disk)
+            st.session_state['_written_snapshot'] = config_snapshot
+        st.session_state['_config_snapshot'] = config_snapshot
+    
+    # Edits that were reverted before the debounce fired don't need a write
+    if st.session_state.get('_config_dirty') and config_snapshot == st.session_state.get('_written_snapshot'):
+        st.session_state['_config_dirty'] = False
+    
+    # Rapid edits are written at most once per CONFIG_SAVE_INTERVAL; flush=True (a run is
+    # starting and will block further reruns) writes a pending edit right away
+    if (st.session_state.get('_config_dirty')
+            and (flush
+                 or time.monotonic() - st.session_state.get('_last_save_at', 0.0) >= CONFIG_SAVE_INTERVAL)):
+        logger.info("Config changed, saving configuration")
+        save_config_to_file()
+
+
+@st.fragment(run_every=CONFIG_SAVE_INTERVAL)
+def _flush_pending_config():
+    """Trailing write of the debounce: an edit made inside the interval is saved on the next tick."""
+    # Without it, the last edit of a burst stays unsaved until some later rerun (or is lost on close)
+    if st.session_state.get('_config_dirty'):
+        _autosave_config()
+
+
+@st.cache_data(show_spinner=False)
+def _load_config_cached(mtime: float) -> dict:
+    """Parse config.json once per file version (keyed on its mtime)."""
+    data = Path(CONFIG_FILE).read_bytes()
+    config = orjson.loads(data) if orjson is not None else json.loads(data)
+    logger.info("Configuration loaded from file")
+    return config
 
 def load_config_from_file():
     """Load configuration from JSON file."""
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            logger.info("Configuration loaded from file")
-            return config
-    except Exception as e:
-        logger.error(f"Failed to load config: {e}")
-    return None
+        config = _load_config_cached(os.path.getmtime(CONFIG_FILE))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:  # unreadable file / invalid JSON (orjson and json errors are ValueErrors)
+        logger.error("Failed to load config: %s", e)
+        return None
+    return config if isinstance(config, dict) else None
+
+
+def _restore_config_keys(prefix=""):
+    """Put back remembered settings whose widget was not rendered (its key reverts or disappears)."""
+    values = st.session_state['_config_values']
+    for key in [k for k in values if k.startswith(prefix)]:
+        # Live widgets already match (on_change keeps _config_values in step), so they are left alone
+        if st.session_state.get(key) != values[key]:
+            st.session_state[key] = values[key]
+
 
 # Initialize session state for configuration persistence
 def init_session_state():
     """Initialize session state with default values or load from file."""
-    # Try to load from file first
-    saved_config = load_config_from_file()
-    
-    # Default values
-    defaults = {
-        'test_mode': "Single Page",
-        'base_url': "https://example.com",
-        'max_depth': 2,
-        'max_pages': 10,
-        'same_origin': True,
-        'include_pattern': "",
-        'exclude_pattern': "",
-        'headless': True,
-        'timeout': 10,
-        'deep_component_test': True,
-        'test_forms': False,
-        'auth_enabled': False,
-        'login_url': "",
-        'auth_username': "",
-        'auth_password': "",
-        'success_indicator': "",
-        'stress_concurrent_users': 3,  # Reduced from 10 to 3
-        'stress_duration': 30,  # Reduced from 60 to 30
-        'stress_ramp_up': 5,  # Reduced from 10 to 5
-        'stress_think_time': 2.0,  # Increased from 1.0 to 2.0 for less CPU usage
-        'stress_timeout': 15,  # Reduced from 30 to 15
-        'stress_actions': "",
-        'load_virtual_users': 10,
-        'load_duration': 60,
-        'load_ramp_up': 10,
-        'load_ramp_down': 10,
-        'load_think_time': 1.0,
-        'load_timeout': 30,
-        'load_scenario_name': "Load Test Scenario",
-        'load_test_plan': "Load Test Plan",
-        'load_max_browsers': 5,
-        'load_memory_limit': 128,
-        'load_enable_monitoring': True,
-        'load_max_cpu': 80,
-        'load_max_memory': 85
-    }
+    if '_config_values' not in st.session_state:
+        # Try to load from file first (once per session)
+        saved_config = load_config_from_file()
+        
+        # Remember when the file was saved for the sidebar status line
+        if saved_config and '_last_saved' not in st.session_state:
+            st.session_state['_last_saved'] = _saved_label(saved_config.get('last_saved', 'Unknown'))
+        
+        # Saved values win over the defaults
+        merged = dict(DEFAULTS)
+        if saved_config:
+            merged.update((key, saved_config[key]) for key in DEFAULTS.keys() & saved_config.keys())
+            # A mode name the radio no longer offers would break its O(1) index lookup
+            if merged['test_mode'] not in _TEST_MODE_IDX:
+                merged['test_mode'] = DEFAULTS['test_mode']
+        st.session_state['_config_values'] = merged
     
-    # Initialize session state with saved config or defaults
-    for key, default_value in defaults.items():
-        if key not in st.session_state:
-            if saved_config and key in saved_config:
-                st.session_state[key] = saved_config[key]
-            else:
-                st.session_state[key] = default_value
+    # Every run: widget keys dropped or reverted since the last run get their value back
+    _restore_config_keys()
 
 init_session_state()
 
 # Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 1rem;
-    }
-    .stMetric {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .success-box {
-        padding: 1rem;
-        background-color: #d4edda;
-        border-left: 4px solid #28a745;
-        border-radius: 0.25rem;
-        margin: 1rem 0;
-    }
-    .error-box {
-        padding: 1rem;
-        background-color: #f8d7da;
-        border-left: 4px solid #dc3545;
-        border-radius: 0.25rem;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Emitted on every run: elements a rerun doesn't re-send are removed from the page, so a
+# "once per session" flag would drop the styles. st.html skips markdown parsing, and a
+# style-only block takes no layout space.
+st.html(_load_css())
 
 # Title and description
 st.markdown('<h1 class="main-header">🔍 Black-Box Functional Testing</h1>', unsafe_allow_html=True)
 st.markdown("**Automated web testing tool** for smoke tests, form validation, and custom YAML scenarios")
 
+# Mode-specific sidebar blocks are fragments (called inside the sidebar below)
+@st.fragment
+def _crawler_sidebar():
+    """Crawler Mode settings; widget changes here rerun only this block, not the whole app."""
+    st.subheader("Crawler Settings")
+    base_url = st.text_input(
+        "Base URL",
+        value=st.session_state.base_url,
+        help="Starting URL for crawling",
+        key="crawler_base_url"
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        max_depth = st.number_input(
+            "Max Depth",
+            min_value=1,
+            max_value=5,
+            value=st.session_state.max_depth,
+            help="Maximum crawling depth",
+            key="crawler_max_depth"
+        )
+    with col2:
+        max_pages = st.number_input(
+            "Max Pages",
+            min_value=1,
+            max_value=100,
+            value=st.session_state.max_pages,
+            help="Maximum pages to test",
+            key="crawler_max_pages"
+        )
+    
+    same_origin = st.checkbox(
+        "Same Origin Only",
+        value=st.session_state.same_origin,
+        help="Only crawl URLs from the same domain",
+        key="crawler_same_origin"
+    )
+    
+    force_recrawl = st.checkbox(
+        "Force re-crawl",
+        value=False,
+        help="Ignore cached crawl results for this URL and settings",
+        key="crawler_force_recrawl"
+    )
+    
+    with st.expander("Advanced Filters"):
+        include_pattern = st.text_input(
+            "Include Pattern (regex)",
+            value=st.session_state.include_pattern,
+            placeholder="e.g., /blog/.*",
+            help="Include URLs matching this pattern",
+            key="crawler_include_pattern"
+        )
+        exclude_pattern = st.text_input(
+            "Exclude Pattern (regex)",
+            value=st.session_state.exclude_pattern,
+            placeholder="e.g., /admin/.*",
+            help="Exclude URLs matching this pattern",
+            key="crawler_exclude_pattern"
+        )
+    
+    return base_url, max_depth, max_pages, same_origin, force_recrawl, include_pattern, exclude_pattern
+
+
+@st.fragment
+def _yaml_sidebar():
+    """YAML Scenario settings; widget changes here rerun only this block, not the whole app."""
+    st.subheader("YAML Scenario")
+    yaml_file = st.file_uploader(
+        "Upload YAML Spec",
+        type=['yaml', 'yml'],
+        help="Upload test scenario YAML file"
+    )
+    
+    scenario_parallelism = st.slider(
+        "Parallel Scenarios",
+        min_value=1,
+        max_value=8,
+        value=st.session_state.scenario_parallelism,
+        help="Run independent scenarios in separate processes (1 = serial)",
+        key="yaml_scenario_parallelism",
+        on_change=_remember_config,
+        args=("scenario_parallelism", "yaml_scenario_parallelism")
+    )
+    
+    if st.button("Generate Sample YAML"):
+        from app.services.yaml_loader import create_sample_yaml
+        sample_path = _sample_yaml_path()
+        create_sample_yaml(sample_path)
+        st.success(f"Sample YAML created at: {sample_path}")
+    
+    return yaml_file, scenario_parallelism
+
+
+@st.fragment
+def _stress_sidebar():
+    """Stress Test settings; widget changes here rerun only this block, not the whole app."""
+    # Bring back settings Streamlit dropped while this block was hidden
+    _restore_config_keys("stress_")
+    st.subheader("Stress Test Settings")
+    stress_url = st.text_input(
+        "Target URL",
+        value=st.session_state.base_url,
+        help="URL yang akan di-stress test",
+        key="stress_test_url"
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        concurrent_users = st.number_input(
+            "Concurrent Users",
+            min_value=1,
+            max_value=100,
+            value=st.session_state.get("stress_concurrent_users", 10),
+            help="Jumlah user bersamaan",
+            key="stress_concurrent_users",
+            on_change=_remember_config,
+            args=("stress_concurrent_users",)
+        )
+    with col2:
+        duration_seconds = st.number_input(
+            "Duration (seconds)",
+            min_value=10,
+            max_value=3600,
+            value=st.session_state.get("stress_duration", 60),
+            help="Durasi test dalam detik",
+            key="stress_duration",
+            on_change=_remember_config,
+            args=("stress_duration",)
+        )
+    
+    col3, col4 = st.columns(2)
+    with col3:
+        ramp_up_seconds = st.number_input(
+            "Ramp Up (seconds)",
+            min_value=0,
+            max_value=300,
+            value=st.session_state.get("stress_ramp_up", 10),
+            help="Waktu untuk mencapai full load",
+            key="stress_ramp_up",
+            on_change=_remember_config,
+            args=("stress_ramp_up",)
+        )
+    with col4:
+        think_time_seconds = st.number_input(
+            "Think Time (seconds)",
+            min_value=0.0,
+            max_value=10.0,
+            value=st.session_state.get("stress_think_time", 1.0),
+            step=0.1,
+            help="Waktu tunggu antara request",
+            key="stress_think_time",
+            on_change=_remember_config,
+            args=("stress_think_time",)
+        )
+    
+    with st.expander("Advanced Stress Test Options"):
+        stress_timeout = st.number_input(
+            "Request Timeout (seconds)",
+            min_value=5,
+            max_value=120,
+            value=st.session_state.get("stress_timeout", 15),
+            help="Timeout per request",
+            key="stress_timeout",
+            on_change=_remember_config,
+            args=("stress_timeout",)
+        )
+    
+        stress_actions = st.text_area(
+            "Custom Actions (JSON)",
+            value=st.session_state.get("stress_actions", ""),
+            help="Aksi tambahan dalam format JSON. Contoh: [{\"type\": \"click\", \"selector\": \"button\"}]",
+            key="stress_actions",
+            on_change=_remember_config,
+            args=("stress_actions",)
+        )
+    
+    # Resource usage warning
+    if concurrent_users > 5:
+        st.warning("⚠️ **Resource Warning**: Concurrent users > 5 dapat menyebabkan CPU usage tinggi. Disarankan untuk test dengan 3-5 users terlebih dahulu.")
+    
+    if duration_seconds > 60:
+        st.warning("⚠️ **Duration Warning**: Test duration > 60 detik dapat memakan banyak resource. Pertimbangkan untuk mengurangi durasi.")
+    
+    # Performance tips
+    with st.expander("💡 Performance Tips"):
+        st.markdown("""
+        **Untuk mengurangi beban CPU dan RAM:**
+    
+        - 🎯 **Mulai kecil**: Gunakan 3-5 concurrent users
+        - ⏱️ **Durasi pendek**: 30-60 detik untuk test awal
+        - 🤔 **Think time tinggi**: 2+ detik untuk mengurangi request frequency
+        - 🚀 **Ramp up**: 5-10 detik untuk gradual load
+        - ⚡ **Timeout pendek**: 10-15 detik untuk efisiensi
+    
+        **Browser optimizations (otomatis):**
+        - 🖼️ Images disabled untuk menghemat RAM
+        - 🧠 JavaScript disabled untuk menghemat CPU
+        - 📱 Smaller viewport (800x600)
+        - 🧹 Aggressive cleanup setelah setiap request
+        """)
+    
+    return (stress_url, concurrent_users, duration_seconds, ramp_up_seconds, think_time_seconds,
+            stress_timeout, stress_actions)
+
+
+@st.fragment
+def _load_sidebar():
+    """Load Generator settings; widget changes here rerun only this block, not the whole app."""
+    # Bring back settings Streamlit dropped while this block was hidden
+    _restore_config_keys("load_")
+    st.subheader("🚀 Load Generator (Enterprise)")
+    
+    # System specs detection
+    cpu_count, memory_gb = _system_specs()
+    
+    # Determine scale
+    if cpu_count >= 16 and memory_gb >= 32:
+        scale = "Large (16+ vCPU, 32+ GB RAM)"
+        max_vu = 10000
+        max_rps = 25000
+    elif cpu_count >= 8 and memory_gb >= 16:
+        scale = "Medium (8 vCPU, 16 GB RAM)"
+        max_vu = 5000
+        max_rps = 10000
+    else:
+        scale = "Small (4 vCPU, 8 GB RAM)"
+        max_vu = 1000
+        max_rps = 1000
+    
+    st.info(f"🖥️ **System Scale**: {scale}")
+    st.info(f"📊 **Recommended Max**: {max_vu} VU, {max_rps} RPS")
+    
+    # Basic configuration
+    load_url = st.text_input(
+        "Target URL",
+        value=st.session_state.base_url,
+        help="URL yang akan di-load test",
+        key="load_generator_url"
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        virtual_users = st.number_input(
+            "Virtual Users",
+            min_value=1,
+            max_value=max_vu,
+            value=st.session_state.get("load_virtual_users", 10),
+            help=f"Jumlah virtual users (max: {max_vu})",
+            key="load_virtual_users",
+            on_change=_remember_config,
+            args=("load_virtual_users",)
+        )
+    with col2:
+        load_duration = st.number_input(
+            "Duration (seconds)",
+            min_value=10,
+            max_value=3600,
+            value=st.session_state.get("load_duration", 60),
+            help="Durasi test dalam detik",
+            key="load_duration",
+            on_change=_remember_config,
+            args=("load_duration",)
+        )
+    
+    col3, col4 = st.columns(2)
+    with col3:
+        ramp_up = st.number_input(
+            "Ramp Up (seconds)",
+            min_value=0,
+            max_value=300,
+            value=st.session_state.get("load_ramp_up", 10),
+            help="Waktu untuk mencapai full load",
+            key="load_ramp_up",
+            on_change=_remember_config,
+            args=("load_ramp_up",)
+        )
+    with col4:
+        ramp_down = st.number_input(
+            "Ramp Down (seconds)",
+            min_value=0,
+            max_value=300,
+            value=st.session_state.get("load_ramp_down", 10),
+            help="Waktu untuk mengurangi load",
+            key="load_ramp_down",
+            on_change=_remember_config,
+            args=("load_ramp_down",)
+        )
+    
+    col5, col6 = st.columns(2)
+    with col5:
+        think_time = st.number_input(
+            "Think Time (seconds)",
+            min_value=0.0,
+            max_value=10.0,
+            value=st.session_state.get("load_think_time", 1.0),
+            step=0.1,
+            help="Waktu tunggu antara request",
+            key="load_think_time",
+            on_change=_remember_config,
+            args=("load_think_time",)
+        )
+    with col6:
+        load_timeout = st.number_input(
+            "Request Timeout (seconds)",
+            min_value=5,
+            max_value=120,
+            value=st.session_state.get("load_timeout", 30),
+            help="Timeout per request",
+            key="load_timeout",
+            on_change=_remember_config,
+            args=("load_timeout",)
+        )
+    
+    # Advanced configuration
+    with st.expander("🔧 Advanced Load Generator Options"):
+        scenario_name = st.text_input(
+            "Scenario Name",
+            value=st.session_state.get("load_scenario_name", "Load Test Scenario"),
+            help="Nama scenario untuk identifikasi",
+            key="load_scenario_name",
+            on_change=_remember_config,
+            args=("load_scenario_name",)
+        )
+    
+        test_plan_name = st.text_input(
+            "Test Plan Name",
+            value=st.session_state.get("load_test_plan", "Load Test Plan"),
+            help="Nama test plan",
+            key="load_test_plan",
+            on_change=_remember_config,
+            args=("load_test_plan",)
+        )
+    
+        max_browsers = st.number_input(
+            "Max Concurrent Browsers",
+            min_value=1,
+            max_value=20,
+            value=st.session_state.get("load_max_browsers", 5),
+            help="Maksimal browser bersamaan",
+            key="load_max_browsers",
+            on_change=_remember_config,
+            args=("load_max_browsers",)
+        )
+    
+        memory_limit = st.number_input(
+            "Browser Memory Limit (MB)",
+            min_value=64,
+            max_value=512,
+            value=st.session_state.get("load_memory_limit", 128),
+            help="Memory limit per browser",
+            key="load_memory_limit",
+            on_change=_remember_config,
+            args=("load_memory_limit",)
+        )
+    
+    # Resource monitoring
+    with st.expander("📊 Resource Monitoring"):
+        enable_monitoring = st.checkbox(
+            "Enable Resource Monitoring",
+            value=st.session_state.get("load_enable_monitoring", True),
+            help="Monitor CPU dan memory usage",
+            key="load_enable_monitoring",
+            on_change=_remember_config,
+            args=("load_enable_monitoring",)
+        )
+    
+        # Stored thresholds still apply when the sliders are hidden
+        max_cpu = st.session_state.get("load_max_cpu", 80)
+        max_memory = st.session_state.get("load_max_memory", 85)
+        if enable_monitoring:
+            col1, col2 = st.columns(2)
+            with col1:
+                max_cpu = st.slider(
+                    "Max CPU Usage (%)",
+                    min_value=50,
+                    max_value=95,
+                    value=st.session_state.get("load_max_cpu", 80),
+                    help="Maksimal CPU usage sebelum warning",
+                    key="load_max_cpu",
+                    on_change=_remember_config,
+                    args=("load_max_cpu",)
+                )
+            with col2:
+                max_memory = st.slider(
+                    "Max Memory Usage (%)",
+                    min_value=50,
+                    max_value=95,
+                    value=st.session_state.get("load_max_memory", 85),
+                    help="Maksimal memory usage sebelum warning",
+                    key="load_max_memory",
+                    on_change=_remember_config,
+                    args=("load_max_memory",)
+                )
+    
+    # Load capacity validation
+    if virtual_users > max_vu * 0.8:
+        st.warning(f"⚠️ **High Load Warning**: {virtual_users} VU mendekati kapasitas maksimal ({max_vu} VU)")
+    
+    if virtual_users > max_vu:
+        st.error(f"❌ **Capacity Exceeded**: {virtual_users} VU melebihi kapasitas sistem ({max_vu} VU)")
+    
+    # Performance estimation
+    estimated_rps = virtual_users / (think_time + 1) if think_time > 0 else virtual_users
+    if estimated_rps > max_rps * 0.8:
+        st.warning(f"⚠️ **RPS Warning**: Estimated {estimated_rps:.1f} RPS mendekati kapasitas ({max_rps} RPS)")
+    
+    # Load generator tips
+    with st.expander("💡 Load Generator Tips"):
+        st.markdown(f"""
+        **System Capacity:**
+        - 🖥️ **Scale**: {scale}
+        - 👥 **Max VU**: {max_vu:,} virtual users
+        - 🚀 **Max RPS**: {max_rps:,} requests per second
+    
+        **Current Configuration:**
+        - 👥 **VU**: {virtual_users:,} virtual users
+        - 🚀 **Estimated RPS**: {estimated_rps:.1f} requests per second
+        - ⏱️ **Duration**: {load_duration} seconds
+        - 📈 **Ramp Up**: {ramp_up} seconds
+        - 📉 **Ramp Down**: {ramp_down} seconds
+    
+        **Performance Tips:**
+        - 🎯 **Start Small**: Mulai dengan 10-50 VU
+        - ⏱️ **Short Duration**: 30-60 detik untuk test awal
+        - 🤔 **Think Time**: 1-3 detik untuk realistic load
+        - 📊 **Monitor Resources**: Watch CPU dan memory usage
+        - 🚀 **Gradual Increase**: Tingkatkan load secara bertahap
+    
+        **Enterprise Features:**
+        - 📊 **Resource Monitoring**: Real-time CPU/memory tracking
+        - 🎭 **Thread Groups**: Multiple concurrent scenarios
+        - 📈 **Performance Metrics**: Detailed response time analysis
+        - 🔍 **Error Analysis**: Comprehensive error categorization
+        - 📊 **Throughput Analysis**: RPS dan peak performance
+        """)
+    
+    return (load_url, virtual_users, load_duration, ramp_up, ramp_down, think_time, load_timeout,
+            scenario_name, test_plan_name, max_browsers, memory_limit, enable_monitoring, max_cpu, max_memory)
+
+
 # Sidebar configuration
 with st.sidebar:
     st.header("⚙️ Configuration")
@@ -261,371 +965,30 @@ with st.sidebar:
     # Mode selection
     test_mode = st.radio(
         "Test Mode",
-        ["Crawler Mode", "YAML Scenario", "Single Page", "Stress Test", "Load Generator"],
-        index=["Crawler Mode", "YAML Scenario", "Single Page", "Stress Test", "Load Generator"].index(st.session_state.test_mode),
+        _TEST_MODES,
+        index=_TEST_MODE_IDX[st.session_state.test_mode],
         help="Choose testing mode",
-        key="test_mode"
+        key="test_mode",
+        on_change=_remember_config,
+        args=("test_mode",)
     )
     
     st.divider()
     
     if test_mode == "Crawler Mode":
-        st.subheader("Crawler Settings")
-        base_url = st.text_input(
-            "Base URL",
-            value=st.session_state.base_url,
-            help="Starting URL for crawling",
-            key="crawler_base_url"
-        )
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            max_depth = st.number_input(
-                "Max Depth",
-                min_value=1,
-                max_value=5,
-                value=st.session_state.max_depth,
-                help="Maximum crawling depth",
-                key="crawler_max_depth"
-            )
-        with col2:
-            max_pages = st.number_input(
-                "Max Pages",
-                min_value=1,
-                max_value=100,
-                value=st.session_state.max_pages,
-                help="Maximum pages to test",
-                key="crawler_max_pages"
-            )
-        
-        same_origin = st.checkbox(
-            "Same Origin Only",
-            value=st.session_state.same_origin,
-            help="Only crawl URLs from the same domain",
-            key="crawler_same_origin"
-        )
-        
-        with st.expander("Advanced Filters"):
-            include_pattern = st.text_input(
-                "Include Pattern (regex)",
-                value=st.session_state.include_pattern,
-                placeholder="e.g., /blog/.*",
-                help="Include URLs matching this pattern",
-                key="crawler_include_pattern"
-            )
-            exclude_pattern = st.text_input(
-                "Exclude Pattern (regex)",
-                value=st.session_state.exclude_pattern,
-                placeholder="e.g., /admin/.*",
-                help="Exclude URLs matching this pattern",
-                key="crawler_exclude_pattern"
-            )
+        base_url, max_depth, max_pages, same_origin, force_recrawl, include_pattern, exclude_pattern = _crawler_sidebar()
     
     elif test_mode == "YAML Scenario":
-        st.subheader("YAML Scenario")
-        yaml_file = st.file_uploader(
-            "Upload YAML Spec",
-            type=['yaml', 'yml'],
-            help="Upload test scenario YAML file"
-        )
-        
-        if st.button("Generate Sample YAML"):
-            sample_path = "tests/sample_specs/generated_sample.yaml"
-            os.makedirs(os.path.dirname(sample_path), exist_ok=True)
-            create_sample_yaml(sample_path)
-            st.success(f"Sample YAML created at: {sample_path}")
+        yaml_file, scenario_parallelism = _yaml_sidebar()
     
     elif test_mode == "Stress Test":
-        st.subheader("Stress Test Settings")
-        stress_url = st.text_input(
-            "Target URL",
-            value=st.session_state.base_url,
-            help="URL yang akan di-stress test",
-            key="stress_test_url"
-        )
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            concurrent_users = st.number_input(
-                "Concurrent Users",
-                min_value=1,
-                max_value=100,
-                value=st.session_state.get("stress_concurrent_users", 10),
-                help="Jumlah user bersamaan",
-                key="stress_concurrent_users"
-            )
-        with col2:
-            duration_seconds = st.number_input(
-                "Duration (seconds)",
-                min_value=10,
-                max_value=3600,
-                value=st.session_state.get("stress_duration", 60),
-                help="Durasi test dalam detik",
-                key="stress_duration"
-            )
-        
-        col3, col4 = st.columns(2)
-        with col3:
-            ramp_up_seconds = st.number_input(
-                "Ramp Up (seconds)",
-                min_value=0,
-                max_value=300,
-                value=st.session_state.get("stress_ramp_up", 10),
-                help="Waktu untuk mencapai full load",
-                key="stress_ramp_up"
-            )
-        with col4:
-            think_time_seconds = st.number_input(
-                "Think Time (seconds)",
-                min_value=0.0,
-                max_value=10.0,
-                value=st.session_state.get("stress_think_time", 1.0),
-                step=0.1,
-                help="Waktu tunggu antara request",
-                key="stress_think_time"
-            )
-        
-        with st.expander("Advanced Stress Test Options"):
-            stress_timeout = st.number_input(
-                "Request Timeout (seconds)",
-                min_value=5,
-                max_value=120,
-                value=st.session_state.get("stress_timeout", 15),
-                help="Timeout per request",
-                key="stress_timeout"
-            )
-            
-            stress_actions = st.text_area(
-                "Custom Actions (JSON)",
-                value=st.session_state.get("stress_actions", ""),
-                help="Aksi tambahan dalam format JSON. Contoh: [{\"type\": \"click\", \"selector\": \"button\"}]",
-                key="stress_actions"
-            )
-        
-        # Resource usage warning
-        if concurrent_users > 5:
-            st.warning("⚠️ **Resource Warning**: Concurrent users > 5 dapat menyebabkan CPU usage tinggi. Disarankan untuk test dengan 3-5 users terlebih dahulu.")
-        
-        if duration_seconds > 60:
-            st.warning("⚠️ **Duration Warning**: Test duration > 60 detik dapat memakan banyak resource. Pertimbangkan untuk mengurangi durasi.")
-        
-        # Performance tips
-        with st.expander("💡 Performance Tips"):
-            st.markdown("""
-            **Untuk mengurangi beban CPU dan RAM:**
-            
-            - 🎯 **Mulai kecil**: Gunakan 3-5 concurrent users
-            - ⏱️ **Durasi pendek**: 30-60 detik untuk test awal
-            - 🤔 **Think time tinggi**: 2+ detik untuk mengurangi request frequency
-            - 🚀 **Ramp up**: 5-10 detik untuk gradual load
-            - ⚡ **Timeout pendek**: 10-15 detik untuk efisiensi
-            
-            **Browser optimizations (otomatis):**
-            - 🖼️ Images disabled untuk menghemat RAM
-            - 🧠 JavaScript disabled untuk menghemat CPU
-            - 📱 Smaller viewport (800x600)
-            - 🧹 Aggressive cleanup setelah setiap request
-            """)
+        (stress_url, concurrent_users, duration_seconds, ramp_up_seconds, think_time_seconds,
+         stress_timeout, stress_actions) = _stress_sidebar()
     
     elif test_mode == "Load Generator":
-        st.subheader("🚀 Load Generator (Enterprise)")
-        
-        # System specs detection
-        import psutil
-        cpu_count = psutil.cpu_count(logical=True)
-        memory_gb = psutil.virtual_memory().total / (1024**3)
-        
-        # Determine scale
-        if cpu_count >= 16 and memory_gb >= 32:
-            scale = "Large (16+ vCPU, 32+ GB RAM)"
-            max_vu = 10000
-            max_rps = 25000
-        elif cpu_count >= 8 and memory_gb >= 16:
-            scale = "Medium (8 vCPU, 16 GB RAM)"
-            max_vu = 5000
-            max_rps = 10000
-        else:
-            scale = "Small (4 vCPU, 8 GB RAM)"
-            max_vu = 1000
-            max_rps = 1000
-        
-        st.info(f"🖥️ **System Scale**: {scale}")
-        st.info(f"📊 **Recommended Max**: {max_vu} VU, {max_rps} RPS")
-        
-        # Basic configuration
-        load_url = st.text_input(
-            "Target URL",
-            value=st.session_state.base_url,
-            help="URL yang akan di-load test",
-            key="load_generator_url"
-        )
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            virtual_users = st.number_input(
-                "Virtual Users",
-                min_value=1,
-                max_value=max_vu,
-                value=st.session_state.get("load_virtual_users", 10),
-                help=f"Jumlah virtual users (max: {max_vu})",
-                key="load_virtual_users"
-            )
-        with col2:
-            load_duration = st.number_input(
-                "Duration (seconds)",
-                min_value=10,
-                max_value=3600,
-                value=st.session_state.get("load_duration", 60),
-                help="Durasi test dalam detik",
-                key="load_duration"
-            )
-        
-        col3, col4 = st.columns(2)
-        with col3:
-            ramp_up = st.number_input(
-                "Ramp Up (seconds)",
-                min_value=0,
-                max_value=300,
-                value=st.session_state.get("load_ramp_up", 10),
-                help="Waktu untuk mencapai full load",
-                key="load_ramp_up"
-            )
-        with col4:
-            ramp_down = st.number_input(
-                "Ramp Down (seconds)",
-                min_value=0,
-                max_value=300,
-                value=st.session_state.get("load_ramp_down", 10),
-                help="Waktu untuk mengurangi load",
-                key="load_ramp_down"
-            )
-        
-        col5, col6 = st.columns(2)
-        with col5:
-            think_time = st.number_input(
-                "Think Time (seconds)",
-                min_value=0.0,
-                max_value=10.0,
-                value=st.session_state.get("load_think_time", 1.0),
-                step=0.1,
-                help="Waktu tunggu antara request",
-                key="load_think_time"
-            )
-        with col6:
-            load_timeout = st.number_input(
-                "Request Timeout (seconds)",
-                min_value=5,
-                max_value=120,
-                value=st.session_state.get("load_timeout", 30),
-                help="Timeout per request",
-                key="load_timeout"
-            )
-        
-        # Advanced configuration
-        with st.expander("🔧 Advanced Load Generator Options"):
-            scenario_name = st.text_input(
-                "Scenario Name",
-                value=st.session_state.get("load_scenario_name", "Load Test Scenario"),
-                help="Nama scenario untuk identifikasi",
-                key="load_scenario_name"
-            )
-            
-            test_plan_name = st.text_input(
-                "Test Plan Name",
-                value=st.session_state.get("load_test_plan", "Load Test Plan"),
-                help="Nama test plan",
-                key="load_test_plan"
-            )
-            
-            max_browsers = st.number_input(
-                "Max Concurrent Browsers",
-                min_value=1,
-                max_value=20,
-                value=st.session_state.get("load_max_browsers", 5),
-                help="Maksimal browser bersamaan",
-                key="load_max_browsers"
-            )
-            
-            memory_limit = st.number_input(
-                "Browser Memory Limit (MB)",
-                min_value=64,
-                max_value=512,
-                value=st.session_state.get("load_memory_limit", 128),
-                help="Memory limit per browser",
-                key="load_memory_limit"
-            )
-        
-        # Resource monitoring
-        with st.expander("📊 Resource Monitoring"):
-            enable_monitoring = st.checkbox(
-                "Enable Resource Monitoring",
-                value=st.session_state.get("load_enable_monitoring", True),
-                help="Monitor CPU dan memory usage",
-                key="load_enable_monitoring"
-            )
-            
-            if enable_monitoring:
-                col1, col2 = st.columns(2)
-                with col1:
-                    max_cpu = st.slider(
-                        "Max CPU Usage (%)",
-                        min_value=50,
-                        max_value=95,
-                        value=st.session_state.get("load_max_cpu", 80),
-                        help="Maksimal CPU usage sebelum warning",
-                        key="load_max_cpu"
-                    )
-                with col2:
-                    max_memory = st.slider(
-                        "Max Memory Usage (%)",
-                        min_value=50,
-                        max_value=95,
-                        value=st.session_state.get("load_max_memory", 85),
-                        help="Maksimal memory usage sebelum warning",
-                        key="load_max_memory"
-                    )
-        
-        # Load capacity validation
-        if virtual_users > max_vu * 0.8:
-            st.warning(f"⚠️ **High Load Warning**: {virtual_users} VU mendekati kapasitas maksimal ({max_vu} VU)")
-        
-        if virtual_users > max_vu:
-            st.error(f"❌ **Capacity Exceeded**: {virtual_users} VU melebihi kapasitas sistem ({max_vu} VU)")
-        
-        # Performance estimation
-        estimated_rps = virtual_users / (think_time + 1) if think_time > 0 else virtual_users
-        if estimated_rps > max_rps * 0.8:
-            st.warning(f"⚠️ **RPS Warning**: Estimated {estimated_rps:.1f} RPS mendekati kapasitas ({max_rps} RPS)")
-        
-        # Load generator tips
-        with st.expander("💡 Load Generator Tips"):
-            st.markdown(f"""
-            **System Capacity:**
-            - 🖥️ **Scale**: {scale}
-            - 👥 **Max VU**: {max_vu:,} virtual users
-            - 🚀 **Max RPS**: {max_rps:,} requests per second
-            
-            **Current Configuration:**
-            - 👥 **VU**: {virtual_users:,} virtual users
-            - 🚀 **Estimated RPS**: {estimated_rps:.1f} requests per second
-            - ⏱️ **Duration**: {load_duration} seconds
-            - 📈 **Ramp Up**: {ramp_up} seconds
-            - 📉 **Ramp Down**: {ramp_down} seconds
-            
-            **Performance Tips:**
-            - 🎯 **Start Small**: Mulai dengan 10-50 VU
-            - ⏱️ **Short Duration**: 30-60 detik untuk test awal
-            - 🤔 **Think Time**: 1-3 detik untuk realistic load
-            - 📊 **Monitor Resources**: Watch CPU dan memory usage
-            - 🚀 **Gradual Increase**: Tingkatkan load secara bertahap
-            
-            **Enterprise Features:**
-            - 📊 **Resource Monitoring**: Real-time CPU/memory tracking
-            - 🎭 **Thread Groups**: Multiple concurrent scenarios
-            - 📈 **Performance Metrics**: Detailed response time analysis
-            - 🔍 **Error Analysis**: Comprehensive error categorization
-            - 📊 **Throughput Analysis**: RPS dan peak performance
-            """)
+        (load_url, virtual_users, load_duration, ramp_up, ramp_down, think_time, load_timeout,
+         scenario_name, test_plan_name, max_browsers, memory_limit, enable_monitoring,
+         max_cpu, max_memory) = _load_sidebar()
     
     else:  # Single Page
         st.subheader("Single Page Test")
@@ -635,6 +998,13 @@ with st.sidebar:
             help="URL of the page to test",
             key="single_page_url"
         )
+        
+        save_artifacts = st.checkbox(
+            "Save artifacts",
+            value=True,
+            help="Untick for a quick check: no screenshots, reports, history entry or deep/form/pentest tests",
+            key="single_page_save_artifacts"
+        )
     
     st.divider()
     
@@ -646,6 +1016,22 @@ with st.sidebar:
         key="test_headless"
     )
     
+    if st.button("♻️ Restart Browsers", help="Close the shared Chromium instances; they relaunch on the next run"):
+        from app.services.browser_pool import shutdown_browser_pools
+        shutdown_browser_pools()
+        st.toast("Browser pool restarted")
+    
+    page_concurrency = st.slider(
+        "Parallel Pages",
+        min_value=1,
+        max_value=8,
+        value=st.session_state.page_concurrency,
+        help="Pages tested at once; each parallel slot runs its own Chromium",
+        key="test_page_concurrency",
+        on_change=_remember_config,
+        args=("page_concurrency", "test_page_concurrency")
+    )
+    
     timeout = st.slider(
         "Timeout (seconds)",
         min_value=5,
@@ -661,6 +1047,32 @@ with st.sidebar:
         key="test_deep_component"
     )
     
+    full_page_screenshot = st.checkbox(
+        "📸 Full-page Screenshots (HD)",
+        value=st.session_state.full_page_screenshot,
+        help="Capture the whole page instead of just the viewport (slower, larger files)",
+        key="test_full_page_screenshot",
+        on_change=_remember_config,
+        args=("full_page_screenshot", "test_full_page_screenshot")
+    )
+    
+    screenshot_quality = st.slider(
+        "Screenshot Quality (JPEG)",
+        min_value=30,
+        max_value=100,
+        value=st.session_state.screenshot_quality,
+        key="test_screenshot_quality",
+        on_change=_remember_config,
+        args=("screenshot_quality", "test_screenshot_quality")
+    )
+    
+    use_result_cache = st.checkbox(
+        "Reuse cached results",
+        value=False,
+        help="Reuse results of identical page tests from the last hour; their artifacts are copied into this run",
+        key="use_result_cache"
+    )
+    
     # Penetration Testing Options
     st.subheader("🔒 Penetration Testing")
     enable_xss_test = st.checkbox(
@@ -681,7 +1093,9 @@ with st.sidebar:
         "Test Forms Submission (Experimental)",
         value=st.session_state.test_forms,
         help="Automatically detect and test form submissions",
-        key="test_forms"
+        key="test_forms",
+        on_change=_remember_config,
+        args=("test_forms",)
     )
     
     # Safe mode option for form testing
@@ -715,174 +1129,771 @@ with st.sidebar:
             - 🔐 Supports meta tag CSRF tokens
             - 🔐 Works with Laravel, Django, Rails, etc.
             
-            **Auto-Safe Mode (NEW!):**
-            - 🛡️ **Automatic Protection**: Even when safe mode is disabled
-            - 🔍 **Smart Detection**: Identifies session issues automatically
-            - ⚡ **Triggers When**: Session timeout < 15 min, no session cookies, invalid session
-            - 🎯 **Form Auth Detection**: Detects forms requiring authentication
-            - 📊 **Detailed Analysis**: Shows why auto-safe mode was triggered
+            **Auto-Safe Mode (NEW!):**
+            - 🛡️ **Automatic Protection**: Even when safe mode is disabled
+            - 🔍 **Smart Detection**: Identifies session issues automatically
+            - ⚡ **Triggers When**: Session timeout < 15 min, no session cookies, invalid session
+            - 🎯 **Form Auth Detection**: Detects forms requiring authentication
+            - 📊 **Detailed Analysis**: Shows why auto-safe mode was triggered
+            
+            **Common Session Issues:**
+            - Session timeout < 30 minutes
+            - Missing session cookies
+            - Invalid authentication tokens
+            - Cross-site request forgery protection
+            """)
+
+    st.divider()
+
+    # Authentication
+    st.subheader("Authentication")
+    auth_enabled = st.checkbox(
+        "Require Login", 
+        value=st.session_state.auth_enabled, 
+        help="Login sebelum test dijalankan",
+        key="auth_enabled",
+        on_change=_remember_config,
+        args=("auth_enabled",)
+    )
+    
+    login_url = st.text_input(
+        "Login URL", 
+        value=st.session_state.login_url, 
+        help="Halaman login",
+        key="auth_login_url"
+    )
+    
+    col_auth1, col_auth2 = st.columns(2)
+    with col_auth1:
+        auth_username = st.text_input(
+            "Username/Email", 
+            value=st.session_state.auth_username, 
+            help="Kredensial login",
+            key="auth_username",
+            on_change=_remember_config,
+            args=("auth_username",)
+        )
+    with col_auth2:
+        auth_password = st.text_input(
+            "Password", 
+            value=st.session_state.auth_password, 
+            type="password",
+            key="auth_password",
+            on_change=_remember_config,
+            args=("auth_password",)
+        )
+    
+    success_indicator = st.text_input(
+        "Success Indicator (CSS atau teks)",
+        value=st.session_state.success_indicator,
+        help="Misal: #dashboard atau teks 'Dashboard'",
+        key="auth_success_indicator"
+    )
+    
+    # Sync widget values to their config keys; persisted by the diff check below
+    st.session_state.login_url = login_url
+    st.session_state.success_indicator = success_indicator
+    st.session_state['_config_values'].update(login_url=login_url, success_indicator=success_indicator)
+    
+    if auth_enabled:
+        auth_config = {
+            "enabled": True,
+            "url": login_url or None,
+            "credentials": {"username": auth_username or None, "password": auth_password or None},
+            "success_indicator": success_indicator or None,
+        }
+    else:
+        auth_config = None
+    
+    st.divider()
+    
+    # Configuration management
+    col_run, col_clear, col_save = st.columns([2, 1, 1])
+    with col_run:
+        run_button = st.button(
+            "🚀 Run Test",
+            type="primary",
+            width="stretch"
+        )
+    with col_clear:
+        # Reset runs as a callback so widget-backed keys can still be assigned
+        st.button("🗑️ Clear", help="Reset all configuration to defaults", on_click=reset_config)
+    with col_save:
+        if st.button("💾 Save", help="Save current configuration to file"):
+            save_config_to_file()
+            st.success("Configuration saved!")
+    
+    # Show config status (tracked in session state; no file access)
+    last_saved = st.session_state.get('_last_saved')
+    if last_saved:
+        st.caption(f"💾 Config saved: {last_saved}")
+    else:
+        st.caption("⚠️ No saved config")
+    
+    # Auto-save when any persisted setting changed (URL/indicator are synced above)
+    _autosave_config(flush=run_button)
+    _flush_pending_config()
+
+@st.cache_data(show_spinner="Generating reports...", ttl=86400)
+def _generate_reports(run_id, artifacts_dir, _results):
+    """Write the HTML/CSV/JSON reports of a run exactly once (keyed on run_id + artifacts dir)."""
+    from app.services.reporter import generate_all_reports
+    return generate_all_reports(_results, artifacts_dir, run_id)
+
+
+@st.cache_data(show_spinner="Generating reports...", ttl=86400)
+def _generate_stress_reports(run_id, artifacts_dir, _stress_results):
+    """Stress-test counterpart of _generate_reports; written once per run_id."""
+    from app.services.reporter import generate_stress_test_reports
+    return generate_stress_test_reports(_stress_results, artifacts_dir, run_id)
+
+
+@st.cache_data(show_spinner=False)
+def _results_df(run_id, n_results, _results):
+    """Detailed results table, built column-wise once per run (keyed on run_id + row count)."""
+    import pandas as pd
+    
+    # Fill all columns in one pass over the results
+    urls, statuses, http, loads, console_errors, network_fails, assertions, forms = ([] for _ in range(8))
+    for r in _results:
+        urls.append(r['url'])
+        statuses.append(r['status'])
+        http.append(r.get('http_status', 'N/A'))
+        loads.append(r.get('load_ms', 'N/A'))
+        console_errors.append(len(r.get('console_errors', ())))
+        network_fails.append(len(r.get('network_failures', ())))
+        a_list = r.get('assertions', ())
+        assertions.append(f"{sum(1 for a in a_list if a.get('pass'))}/{len(a_list)}")
+        forms.append(r.get('forms_found', 0))
+    
+    return _arrow_table(pd.DataFrame({
+        'URL': urls,
+        'Status': statuses,
+        'HTTP': http,
+        'Load (ms)': loads,
+        'Console Errors': console_errors,
+        'Network Fails': network_fails,
+        'Assertions': assertions,
+        'Forms': forms
+    }))
+
+
+def _arrow_table(df):
+    """Convert a DataFrame to an Arrow table once, so st.dataframe does not re-convert it every rerun."""
+    import pyarrow as pa
+    
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type columns (e.g. ints and 'N/A') are shown as text, as Streamlit itself would
+        mixed = {col: str for col in df.columns if df[col].dtype == object}
+        return pa.Table.from_pandas(df.astype(mixed), preserve_index=False)
+
+
+def _records_table(rows, columns):
+    """DataFrame of the given record fields; columns maps field -> (header, default)."""
+    import pandas as pd
+    
+    df = pd.DataFrame.from_records(rows).reindex(columns=list(columns))
+    df = df.fillna({field: default for field, (_, default) in columns.items()})
+    return df.rename(columns={field: header for field, (header, _) in columns.items()})
+
+
+def _error_table(errors, total_requests):
+    """Error Type / Count / Percentage table of a stress or load run, computed column-wise."""
+    import pandas as pd
+    
+    counts = pd.Series(errors, dtype="int64")
+    share = counts / total_requests * 100 if total_requests > 0 else counts * 0.0
+    return pd.DataFrame({
+        'Error Type': counts.index,
+        'Count': counts.values,
+        'Percentage': share.map('{:.1f}%'.format).values,
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _component_tables(run_id, url, _comp):
+    """All button/image/link/form-input rows of one page as Arrow tables, built once per run + URL."""
+    import pandas as pd
+    
+    buttons = _records_table(_comp.get('buttons', {}).get('buttons_tested') or [], {
+        'text': ("Text", 'N/A'),
+        'status': ("Status", 'N/A'),
+        'visible': ("Visible", False),
+        'enabled': ("Enabled", False),
+    })
+    
+    images = _records_table(_comp.get('images', {}).get('images_tested') or [], {
+        'src': ("Source", 'N/A'),
+        'alt': ("Alt", 'N/A'),
+        'width': ("Width", 0),
+        'height': ("Height", 0),
+        'status': ("Status", 'N/A'),
+    })
+    images["Source"] = images["Source"].astype(str).str.slice(0, 50)
+    width, height = (pd.to_numeric(images.pop(c), errors='coerce').fillna(0).astype(int).astype(str) for c in ("Width", "Height"))
+    images.insert(2, "Size", width + "x" + height)
+    
+    links = _records_table(_comp.get('links', {}).get('links_tested') or [], {
+        'text': ("Text", 'N/A'),
+        'href': ("Href", 'N/A'),
+        'type': ("Type", 'N/A'),
+        'status': ("Status", 'N/A'),
+    })
+    links["Href"] = links["Href"].astype(str).str.slice(0, 50)
+    
+    form_inputs = [
+        _arrow_table(_records_table(form.get('inputs') or [], {
+            'name': ("Name", 'N/A'),
+            'type': ("Type", 'N/A'),
+        }))
+        for form in _comp.get('forms', {}).get('forms_tested') or []
+    ]
+    
+    return {
+        'buttons': _arrow_table(buttons),
+        'images': _arrow_table(images),
+        'links': _arrow_table(links),
+        'form_inputs': form_inputs,
+    }
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _existing_screenshots(run_id, n_results, _results, _form_pages):
+    """Form-test screenshot paths of a run that exist on disk, stat'ed once per minute."""
+    existing = set()
+    # Only pages indexed as having form-test data, not the whole run
+    for i in _form_pages:
+        form_test = _results[i].get('form_test')
+        if not isinstance(form_test, dict):
+            continue
+        for key in ('screenshot_before_path', 'screenshot_after_path'):
+            path = form_test.get(key)
+            if isinstance(path, str) and path and os.path.exists(path):
+                existing.add(path)
+    return existing
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _screenshot_thumb(path: str, mtime: float) -> bytes:
+    """Downscaled JPEG (max 800px) of a screenshot, built once per file version."""
+    from io import BytesIO
+    from PIL import Image
+    
+    with Image.open(path) as img:
+        img.thumbnail((800, 800))
+        buf = BytesIO()
+        img.convert("RGB").save(buf, format="JPEG", quality=70)
+    return buf.getvalue()
+
+
+def _show_screenshot(path: str, caption: str):
+    """Show a screenshot thumbnail inline; the full-size file is only sent on download."""
+    st.image(_screenshot_thumb(path, os.path.getmtime(path)), caption=caption, width="stretch")
+    st.download_button(
+        "⬇️ Full size",
+        data=partial(_load_bytes, path),
+        file_name=os.path.basename(path),
+        key=f"full_{caption}_{path}"
+    )
+
+
+def _pick_result(results, indices, short_urls, key):
+    """Let the user choose one of the indexed pages; returns (result, short URL) or (None, None)."""
+    if len(indices) <= 1:
+        return (results[indices[0]], short_urls[indices[0]]) if indices else (None, None)
+    choice = st.selectbox(
+        f"Page ({len(indices)} tested)",
+        indices,
+        format_func=short_urls.__getitem__,
+        key=key
+    )
+    return results[choice], short_urls[choice]
+
+
+@st.fragment
+def render_page_results(view):
+    """Render summary, detail sections and report downloads of a page test run.
+    
+    A fragment: picking a page, toggling the preview or downloading reruns only this
+    view, not the sidebar and the rest of the app.
+    """
+    results = view['results']
+    run_id = view['run_id']
+    artifacts_dir = view['artifacts_dir']
+    report_paths = view['report_paths']
+    passed_count = view['passed_count']
+    failed_count = view['failed_count']
+    deep_component_test = view['deep_component_test']
+    test_forms = view['test_forms']
+    enable_xss_test = view['enable_xss_test']
+    enable_sql_test = view['enable_sql_test']
+    detail_pages = view['detail_pages']
+    short_urls = view['short_urls']
+    
+    # Display summary metrics
+    st.subheader("📈 Summary")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    total_console_errors = view['total_console_errors']
+    avg_load = view['avg_load']
+    pass_rate = int((passed_count / len(results) * 100)) if results else 0
+    
+    col1.metric("Total Pages", len(results))
+    col2.metric("Passed", passed_count, delta=f"{pass_rate}%")
+    col3.metric("Failed", failed_count)
+    col4.metric("Console Errors", total_console_errors)
+    col5.metric("Avg Load Time", f"{avg_load}ms")
+    
+    # Results table
+    st.subheader("📋 Detailed Results")
+    
+    st.dataframe(
+        _results_df(run_id, len(results), results),
+        width="stretch",
+        hide_index=True
+    )
+    
+    # Show error messages if any
+    if detail_pages['errors']:
+        st.error("⚠️ **Errors Detected:**")
+        for i in detail_pages['errors']:
+            with st.expander(f"❌ Error for {short_urls[i]}..."):
+                st.code(results[i].get('error', 'Unknown error'), language="text")
+    
+    # Display Component Test Results (if enabled)
+    if deep_component_test and detail_pages['component_tests']:
+        st.subheader("🔍 Detailed Component Analysis")
+        
+        r, short_url = _pick_result(results, detail_pages['component_tests'], short_urls, f"component_page_{run_id}")
+        if r is not None:
+            comp = r['component_tests']
+            summary = comp.get('summary', {})
+            
+            with st.expander(f"📄 {short_url}... - Component Details", expanded=True):
+                # Summary metrics
+                col1, col2, col3, col4 = st.columns(4)
+                
+                col1.metric(
+                    "Buttons",
+                    f"{summary.get('working_buttons', 0)}/{summary.get('total_buttons', 0)}",
+                    delta="Working"
+                )
+                col2.metric(
+                    "Images",
+                    f"{summary.get('loaded_images', 0)}/{summary.get('total_images', 0)}",
+                    delta=f"{summary.get('broken_images', 0)} broken" if summary.get('broken_images', 0) > 0 else "All OK",
+                    delta_color="inverse" if summary.get('broken_images', 0) > 0 else "normal"
+                )
+                col3.metric(
+                    "Links",
+                    summary.get('valid_links', 0),
+                    delta="Valid"
+                )
+                col4.metric(
+                    "Forms",
+                    f"{summary.get('complete_forms', 0)}/{summary.get('total_forms', 0)}",
+                    delta="Complete"
+                )
+                
+                # Detailed tabs
+                tables = _component_tables(run_id, r['url'], comp)
+                tab_btn, tab_img, tab_link, tab_form = st.tabs(["Buttons", "Images", "Links", "Forms"])
+                
+                with tab_btn:
+                    buttons = comp.get('buttons', {})
+                    st.markdown(
+                        f"**Total Buttons:** {buttons.get('total_buttons', 0)}\n\n"
+                        f"**Clickable:** {buttons.get('clickable_buttons', 0)}\n\n"
+                        f"**Disabled:** {buttons.get('disabled_buttons', 0)}\n\n"
+                        f"**Hidden:** {buttons.get('hidden_buttons', 0)}"
+                    )
+                    
+                    if buttons.get('buttons_tested'):
+                        st.dataframe(tables['buttons'], width="stretch", hide_index=True)
+                
+                with tab_img:
+                    images = comp.get('images', {})
+                    st.markdown(
+                        f"**Total Images:** {images.get('total_images', 0)}\n\n"
+                        f"**Loaded:** {images.get('loaded_images', 0)}\n\n"
+                        f"**Broken:** {images.get('broken_images', 0)}\n\n"
+                        f"**Without Alt:** {images.get('images_without_alt', 0)}"
+                    )
+                    
+                    if images.get('images_tested'):
+                        st.dataframe(tables['images'], width="stretch", hide_index=True)
+                
+                with tab_link:
+                    links = comp.get('links', {})
+                    st.markdown(
+                        f"**Total Links:** {links.get('total_links', 0)}\n\n"
+                        f"**Valid Links:** {links.get('valid_links', 0)}\n\n"
+                        f"**Empty Links:** {links.get('empty_links', 0)}\n\n"
+                        f"**External:** {links.get('external_links', 0)}\n\n"
+                        f"**Internal:** {links.get('internal_links', 0)}"
+                    )
+                    
+                    if links.get('links_tested'):
+                        st.dataframe(tables['links'], width="stretch", hide_index=True)
+                
+                with tab_form:
+                    forms = comp.get('forms', {})
+                    st.markdown(
+                        f"**Total Forms:** {forms.get('total_forms', 0)}\n\n"
+                        f"**With Action:** {forms.get('forms_with_action', 0)}\n\n"
+                        f"**With Submit Button:** {forms.get('forms_with_submit', 0)}"
+                    )
+                    
+                    if forms.get('forms_tested'):
+                        for form_idx, form in enumerate(forms['forms_tested']):
+                            st.markdown(
+                                f"**Form {form_idx + 1}:**\n"
+                                f"- Action: `{form.get('action', 'N/A')}`\n"
+                                f"- Method: `{form.get('method', 'GET')}`\n"
+                                f"- Inputs: {form.get('input_count', 0)}\n"
+                                f"- Status: {form.get('status', 'N/A')}"
+                            )
+                            
+                            if form.get('inputs'):
+                                st.dataframe(tables['form_inputs'][form_idx], width="stretch", hide_index=True)
+                            st.divider()
+    
+    # Display Form Testing Results (if enabled)
+    if test_forms and detail_pages['form_test']:
+        st.subheader("📋 Form Testing Results")
+        
+        r, short_url = _pick_result(results, detail_pages['form_test'], short_urls, f"form_page_{run_id}")
+        if r is not None and r.get('form_test'):
+            form_test = r['form_test']
+            
+            # Validate form_test structure
+            if not isinstance(form_test, dict):
+                st.error(f"❌ Invalid form test data structure for {r.get('url', 'Unknown URL')}")
+            else:
+                with st.expander(f"📝 Form Test Results - {short_url}...", expanded=True):
+                    # Form test summary
+                    col1, col2, col3 = st.columns(3)
+                    
+                    # Safe access to form_test properties
+                    success = form_test.get('success', False) if isinstance(form_test.get('success'), bool) else False
+                    
+                    col1.metric(
+                        "Form Test Status",
+                        "✅ Success" if success else "❌ Failed",
+                        delta="Success" if success else "Failed"
+                    )
+                    
+                    # Safe access to fill_result
+                    fill_result = form_test.get('fill_result')
+                    if fill_result is None or not isinstance(fill_result, dict):
+                        fill_result = {}
+                    
+                    fields_filled = fill_result.get('fields_filled', 0) if isinstance(fill_result.get('fields_filled'), int) else 0
+                    fields_failed = fill_result.get('fields_failed', 0) if isinstance(fill_result.get('fields_failed'), int) else 0
+                    
+                    col2.metric(
+                        "Fields Filled",
+                        fields_filled,
+                        delta=f"{fields_failed} failed" if fields_failed > 0 else "All OK"
+                    )
+                    
+                    submitted = form_test.get('submitted', False) if isinstance(form_test.get('submitted'), bool) else False
+                    col3.metric(
+                        "Form Submitted",
+                        "✅ Yes" if submitted else "❌ No",
+                        delta="Submitted" if submitted else "Not Submitted"
+                    )
+                    
+                    # Form test details
+                    st.write("**Form Test Details:**")
+                    
+                    # Safe Mode indicator
+                    safe_mode = form_test.get('safe_mode', False)
+                    if safe_mode:
+                        auto_safe_mode = form_test.get('auto_safe_mode', False)
+                        if auto_safe_mode:
+                            st.warning("🛡️ **Auto-Safe Mode Active** - Form filled without submission to preserve session (automatic protection)")
+                        else:
+                            st.info("🛡️ **Safe Mode Active** - Form filled without submission to preserve session")
+                        
+                        safe_mode_reason = form_test.get('safe_mode_reason')
+                        if safe_mode_reason:
+                            st.write(f"**Reason:** {safe_mode_reason}")
+                    
+                        # Show detailed safe mode information
+                        message = form_test.get('message')
+                        if message:
+                            st.write(f"**Message:** {message}")
+                    
+                    # Session timeout information
+                    session_timeout_info = form_test.get('session_timeout_info')
+                    if session_timeout_info and isinstance(session_timeout_info, dict):
+                        has_timeout = session_timeout_info.get('has_timeout', False)
+                        if has_timeout:
+                            timeout_minutes = session_timeout_info.get('timeout_minutes', 'N/A')
+                            st.warning(f"⏰ **Session Timeout Detected:** {timeout_minutes} minutes")
+                            
+                            warnings = session_timeout_info.get('warnings')
+                            if warnings and isinstance(warnings, list):
+                                for warning in warnings:
+                                    if isinstance(warning, str):
+                                        st.warning(f"⚠️ {warning}")
+                    
+                    # Session recovery information
+                    session_restored = form_test.get('session_restored', False)
+                    if session_restored:
+                        session_recovery_success = form_test.get('session_recovery_success', False)
+                        if session_recovery_success:
+                            st.success("🔄 **Session Recovery Successful** - User returned to authenticated state")
+                        else:
+                            st.error("❌ **Session Recovery Failed** - Still on login page")
+                    
+                    # Redirect analysis
+                    redirect_analysis = form_test.get('redirect_analysis')
+                    if redirect_analysis and isinstance(redirect_analysis, dict):
+                        redirect_cause = redirect_analysis.get('redirect_cause', 'Unknown')
+                        lines = ["**🔍 Redirect Analysis:**", "", f"**Cause:** {redirect_cause}"]
+                        
+                        error_messages = redirect_analysis.get('error_messages')
+                        if error_messages and isinstance(error_messages, list):
+                            lines += ["", "**Error Messages Found:**"]
+                            # Show first 3
+                            lines += [f"- {error.get('text', 'N/A')}" for error in error_messages[:3]
+                                      if isinstance(error, dict)]
+                        
+                        recommendations = redirect_analysis.get('recommendations')
+                        if recommendations and isinstance(recommendations, list):
+                            lines += ["", "**💡 Recommendations:**"]
+                            lines += [f"- {rec}" for rec in recommendations if isinstance(rec, str)]
+                        st.markdown("\n".join(lines))
+                    
+                    # CSRF Token Support
+                    csrf_tokens_found = form_test.get('csrf_tokens_found', 0)
+                    if isinstance(csrf_tokens_found, (int, float)) and csrf_tokens_found > 0:
+                        st.success(f"🔐 **CSRF Protection:** {csrf_tokens_found} token(s) found")
+                        csrf_token_added = form_test.get('csrf_token_added', False)
+                        if csrf_token_added:
+                            st.info("🔐 **CSRF Token Added** - Token automatically added to form")
+                    
+                    # Success/Error indicators
+                    has_success_message = form_test.get('has_success_message', False)
+                    if has_success_message:
+                        st.success("✅ Success message detected on page")
+                    
+                    has_error_message = form_test.get('has_error_message', False)
+                    if has_error_message:
+                        st.error("❌ Error message detected on page")
+                    
+                    # URL change
+                    url_changed = form_test.get('url_changed', False)
+                    if url_changed:
+                        st.info("🔄 URL changed after form submission")
+                    
+                    # Validation errors
+                    form_validation_errors = form_test.get('form_validation_errors')
+                    if form_validation_errors and isinstance(form_validation_errors, list):
+                        st.error("⚠️ Form validation errors detected:")
+                        rows = [error for error in form_validation_errors if isinstance(error, dict)]
+                        st.dataframe(_records_table(rows[:20], {'text': ("Error", 'N/A')}),
+                                     width="stretch", hide_index=True)
+                    
+                    # Network errors
+                    network_errors = form_test.get('network_errors')
+                    if network_errors and isinstance(network_errors, list):
+                        st.error("🌐 Network errors during form submission:")
+                        rows = [error for error in network_errors if isinstance(error, dict)]
+                        st.dataframe(_records_table(rows[:20], {'url': ("URL", 'N/A'), 'failure': ("Failure", 'N/A')}),
+                                     width="stretch", hide_index=True)
+                    
+                    # Screenshot evidence
+                    st.write("**📸 Screenshot Evidence:**")
+                    
+                    screenshot_before = form_test.get('screenshot_before_path')
+                    screenshot_after = form_test.get('screenshot_after_path')
+                    
+                    existing_shots = _existing_screenshots(run_id, len(results), results, detail_pages['form_test'])
+                    if screenshot_before in existing_shots:
+                        st.write("**Before Form Submission:**")
+                        _show_screenshot(screenshot_before, "Form before submission")
+                    
+                    if screenshot_after in existing_shots:
+                        safe_mode = form_test.get('safe_mode', False)
+                        if safe_mode:
+                            st.write("**After Form Filling (Safe Mode):**")
+                            _show_screenshot(screenshot_after, "Form after filling (submission skipped)")
+                        else:
+                            st.write("**After Form Submission:**")
+                            _show_screenshot(screenshot_after, "Form after submission")
+                    
+                    # Form test errors
+                    form_test_errors = form_test.get('errors')
+                    if form_test_errors and isinstance(form_test_errors, list):
+                        st.error("**Form Test Errors:**")
+                        st.markdown("\n".join(f"- {error}" for error in form_test_errors if isinstance(error, str)))
+                    
+                    st.divider()
+            
+            # Handle form test errors (when form_test is None but form_test_error exists)
+        elif r is not None and r.get('form_test_error'):
+            form_test_error = r['form_test_error']
             
-            **Common Session Issues:**
-            - Session timeout < 30 minutes
-            - Missing session cookies
-            - Invalid authentication tokens
-            - Cross-site request forgery protection
-            """)
-
-    st.divider()
-
-    # Authentication
-    st.subheader("Authentication")
-    def on_auth_enabled_change():
-        st.session_state.auth_enabled = st.session_state.auth_enabled
-        save_config_to_file()
-        logger.info(f"Auth enabled changed to: {st.session_state.auth_enabled}")
-    
-    auth_enabled = st.checkbox(
-        "Require Login", 
-        value=st.session_state.auth_enabled, 
-        help="Login sebelum test dijalankan",
-        key="auth_enabled",
-        on_change=on_auth_enabled_change
-    )
-    
-    def on_login_url_change():
-        st.session_state.login_url = st.session_state.auth_login_url
-        save_config_to_file()
-        logger.info(f"Login URL changed to: '{st.session_state.auth_login_url}'")
+            with st.expander(f"❌ Form Test Error - {short_url}...", expanded=True):
+                st.error(f"**Form Test Failed:** {form_test_error}")
+                st.info("Form testing encountered an error. This could be due to:")
+                st.markdown(
+                    "- No forms found on the page\n"
+                    "- Form elements not accessible\n"
+                    "- Page structure issues\n"
+                    "- Network or timeout errors"
+                )
+                st.divider()
     
-    login_url = st.text_input(
-        "Login URL", 
-        value=st.session_state.login_url, 
-        help="Halaman login",
-        key="auth_login_url",
-        on_change=on_login_url_change
-    )
+    # Display Penetration Testing Results
+    if (enable_xss_test or enable_sql_test) and detail_pages['pentest']:
+        st.subheader("🔒 Penetration Testing Results")
+        
+        r, short_url = _pick_result(results, detail_pages['pentest'], short_urls, f"pentest_page_{run_id}")
+        if r is not None:
+            pentest_results = []
+            
+            # XSS Test Results
+            if 'xss_test' in r and r['xss_test']:
+                xss_test = r['xss_test']
+                pentest_results.append(('XSS', xss_test))
+            
+            # SQL Test Results  
+            if 'sql_test' in r and r['sql_test']:
+                sql_test = r['sql_test']
+                pentest_results.append(('SQL Injection', sql_test))
+            
+            if pentest_results:
+                with st.expander(f"🔒 Penetration Test Results - {short_url}...", expanded=True):
+                    for test_type, test_data in pentest_results:
+                        st.write(f"**{test_type} Testing:**")
+                        
+                        summary = test_data.get('summary', {})
+                        vulnerabilities = summary.get('vulnerabilities_found', 0)
+                        
+                        if vulnerabilities > 0:
+                            st.error(f"🚨 **{vulnerabilities} vulnerabilities found!**")
+                            
+                            # Show detailed results
+                            vulns = [t for t in test_data.get('form_tests', []) if t.get('is_vulnerable')]
+                            if vulns:
+                                vuln_df = _records_table(vulns[:50], {
+                                    'input_name': ("Input", 'N/A'),
+                                    'payload': ("Payload", 'N/A'),
+                                    'risk_level': ("Risk Level", 'N/A'),
+                                    'response_snippet': ("Response", ''),
+                                })
+                                vuln_df['Response'] = vuln_df['Response'].astype(str).str[:200]
+                                st.dataframe(vuln_df, width="stretch", hide_index=True)
+                        else:
+                            st.success(f"✅ No {test_type} vulnerabilities found")
+                        
+                        st.divider()
     
-    def on_auth_username_change():
-        st.session_state.auth_username = st.session_state.auth_username
-        save_config_to_file()
-        logger.info(f"Auth username changed to: '{st.session_state.auth_username}'")
+    # Generate reports
+    st.subheader("📄 Export Reports")
     
-    def on_auth_password_change():
-        st.session_state.auth_password = st.session_state.auth_password
-        save_config_to_file()
-        logger.info("Auth password changed")
+    # File contents are read only when a button is clicked, not on every rerun
+    col1, col2, col3, col4, col5 = st.columns(5)
     
-    col_auth1, col_auth2 = st.columns(2)
-    with col_auth1:
-        auth_username = st.text_input(
-            "Username/Email", 
-            value=st.session_state.auth_username, 
-            help="Kredensial login",
-            key="auth_username",
-            on_change=on_auth_username_change
+    # HTML Report
+    with col1:
+        st.download_button(
+            "📊 Download HTML",
+            partial(_load_bytes, report_paths['html']),
+            file_name=f"report_{run_id}.html",
+            mime="text/html"
         )
-    with col_auth2:
-        auth_password = st.text_input(
-            "Password", 
-            value=st.session_state.auth_password, 
-            type="password",
-            key="auth_password",
-            on_change=on_auth_password_change
-        )
-    
-    def on_success_indicator_change():
-        st.session_state.success_indicator = st.session_state.auth_success_indicator
-        save_config_to_file()
-        logger.info(f"Success Indicator changed to: '{st.session_state.auth_success_indicator}'")
-    
-    success_indicator = st.text_input(
-        "Success Indicator (CSS atau teks)",
-        value=st.session_state.success_indicator,
-        help="Misal: #dashboard atau teks 'Dashboard'",
-        key="auth_success_indicator",
-        on_change=on_success_indicator_change
-    )
-    
-    auth_config = None
-    if auth_enabled:
-        auth_config = {
-            "enabled": True,
-            "url": login_url or None,
-            "credentials": {"username": auth_username or None, "password": auth_password or None},
-            "success_indicator": success_indicator or None,
-        }
-    
-    st.divider()
     
-    # Configuration management
-    col_run, col_clear, col_save = st.columns([2, 1, 1])
-    with col_run:
-        run_button = st.button(
-            "🚀 Run Test",
-            type="primary",
-            width="stretch"
+    # CSV Report
+    with col2:
+        st.download_button(
+            "📈 Download CSV",
+            partial(_load_bytes, report_paths['csv']),
+            file_name=f"report_{run_id}.csv",
+            mime="text/csv"
         )
-    with col_clear:
-        if st.button("🗑️ Clear", help="Reset all configuration to defaults"):
-            # Clear all session state
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            # Remove config file
-            if os.path.exists(CONFIG_FILE):
-                os.remove(CONFIG_FILE)
-            st.rerun()
-    with col_save:
-        if st.button("💾 Save", help="Save current configuration to file"):
-            save_config_to_file()
-            st.success("Configuration saved!")
     
-    # Show config status
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            last_saved = config_data.get('last_saved', 'Unknown')
-            st.caption(f"💾 Config saved: {last_saved[:19] if last_saved != 'Unknown' else 'Unknown'}")
-        except:
-            st.caption("💾 Config file exists")
-    else:
-        st.caption("⚠️ No saved config")
+    # JSON Report
+    with col3:
+        st.download_button(
+            "🔧 Download JSON",
+            partial(_load_bytes, report_paths['json']),
+            file_name=f"report_{run_id}.json",
+            mime="application/json"
+        )
     
-    # Auto-save configuration when authentication settings change
-    if 'last_auth_config' not in st.session_state:
-        st.session_state.last_auth_config = ""
+    # PDF Report
+    with col4:
+        if 'pdf' in report_paths and os.path.exists(report_paths['pdf']):
+            st.download_button(
+                "📄 Download PDF",
+                partial(_load_bytes, report_paths['pdf']),
+                file_name=f"report_{run_id}.pdf",
+                mime="application/pdf"
+            )
+        else:
+            st.error("❌ PDF not available")
     
-    # Get current values from session state (not from variables)
-    current_auth_enabled = st.session_state.get("auth_enabled", False)
-    current_login_url = st.session_state.get("login_url", "")
-    current_auth_username = st.session_state.get("auth_username", "")
-    current_auth_password = st.session_state.get("auth_password", "")
-    current_success_indicator = st.session_state.get("success_indicator", "")
+    # All reports in one archive
+    with col5:
+        st.download_button(
+            "📦 Download all (.zip)",
+            partial(_report_bundle, report_paths, run_id),
+            file_name=f"reports_{run_id}.zip",
+            mime="application/zip"
+        )
     
-    current_auth_config = f"{current_auth_enabled}_{current_login_url}_{current_auth_username}_{current_auth_password}_{current_success_indicator}"
+    st.success(f"✅ Reports saved to: `{artifacts_dir}`")
     
-    if current_auth_config != st.session_state.last_auth_config:
-        logger.info(f"Auth config changed, saving... Login URL: '{current_login_url}', Success Indicator: '{current_success_indicator}'")
-        save_config_to_file()
-        st.session_state.last_auth_config = current_auth_config
+    # View HTML report (only loaded when the toggle is on)
+    if st.toggle("👁️ Preview HTML Report", key="preview_html"):
+        if st.get_option("server.enableStaticServing"):
+            # Browser fetches the file itself instead of receiving it over the websocket
+            st.components.v1.iframe(_static_report_url(report_paths['html'], run_id), height=600, scrolling=True)
+        else:
+            st.components.v1.html(_html_body(report_paths['html']), height=600, scrolling=True)
+
 
 # Main content area
 tab1, tab2, tab3 = st.tabs(["📊 Test Results", "📜 History", "ℹ️ About"])
 
 with tab1:
     if run_button:
+        # Record start time; the run ID is derived from it
+        start_time = datetime.now()
+        
         # Generate run ID
-        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Random suffix keeps runs started in the same second apart; mkdir fails loudly on a clash
+        run_id = f"{start_time:%Y%m%d_%H%M%S}_{secrets.token_hex(3)}"
         artifacts_dir = f"artifacts/{run_id}"
-        os.makedirs(artifacts_dir, exist_ok=True)
-        
-        # Record start time
-        start_time = datetime.now()
+        if not (test_mode == "Single Page" and not save_artifacts):
+            Path(artifacts_dir).mkdir(parents=True, exist_ok=False)
         
         # Initialize results
         results = []
         urls_to_test = []
+        st.session_state.pop("last_run_view", None)
         
         try:
             # Determine URLs to test based on mode
             if test_mode == "Crawler Mode":
+                from app.runners.crawl import crawl_site_with_auth
+                
+                # Compile URL filters once up front (also rejects invalid regex before crawling)
+                try:
+                    include_patterns = [re.compile(include_pattern)] if include_pattern else None
+                    exclude_patterns = [re.compile(exclude_pattern)] if exclude_pattern else None
+                except re.error as e:
+                    st.error(f"❌ Invalid URL pattern: {e}")
+                    st.stop()
+                
                 st.info(f"🕷️ Starting crawler from: {base_url}")
                 
                 # Create database record
@@ -898,9 +1909,6 @@ with tab1:
                 update_test_run(run_id, status="running")
                 
                 with st.spinner("Crawling website..."):
-                    include_patterns = [include_pattern] if include_pattern else None
-                    exclude_patterns = [exclude_pattern] if exclude_pattern else None
-                    
                     # Use authenticated crawler if auth is enabled
                     if auth_config and auth_config.get("enabled"):
                         st.info("🔐 Using authenticated crawler with login session")
@@ -916,30 +1924,35 @@ with tab1:
                             headless=headless
                         )
                     else:
-                        urls_to_test = crawl_site(
-                            base_url=base_url,
-                            max_depth=max_depth,
-                            max_pages=max_pages,
-                            same_origin_only=same_origin,
-                            include_patterns=include_patterns,
-                            exclude_patterns=exclude_patterns,
-                            timeout=timeout
+                        if force_recrawl:
+                            _cached_crawl.clear()
+                        urls_to_test = _cached_crawl(
+                            base_url,
+                            max_depth,
+                            max_pages,
+                            same_origin,
+                            tuple(include_patterns or ()),
+                            tuple(exclude_patterns or ()),
+                            timeout
                         )
                 
                 st.success(f"✅ Found {len(urls_to_test)} pages to test")
             
             elif test_mode == "YAML Scenario":
+                from app.runners.playwright_runner import run_yaml_scenario, run_scenario_worker
+                from app.services.browser_pool import get_browser_pool
                 if yaml_file is None:
                     st.warning("⚠️ Please upload a YAML file")
                     st.stop()
                 
-                # Save uploaded file
+                # Load and validate YAML straight from the upload
+                spec = _parse_yaml_spec(yaml_file.file_id, yaml_file)
+                
+                # Keep a copy of the spec with the run artifacts
                 yaml_path = os.path.join(artifacts_dir, "spec.yaml")
+                yaml_file.seek(0)
                 with open(yaml_path, 'wb') as f:
-                    f.write(yaml_file.read())
-                
-                # Load and validate YAML
-                spec = load_yaml_spec(yaml_path)
+                    shutil.copyfileobj(yaml_file, f, length=64 * 1024)
                 
                 st.info(f"📋 Running {len(spec.scenarios)} scenarios from YAML")
                 
@@ -951,22 +1964,22 @@ with tab1:
                 )
                 update_test_run(run_id, status="running")
                 
-                # Run scenarios
+                # Prepare scenario jobs
+                scenario_auth = spec.auth.dict() if (spec.auth and spec.auth.enabled) else None
+                scenario_jobs = []
                 for idx, scenario in enumerate(spec.scenarios):
-                    scenario_dir = os.path.join(artifacts_dir, f"scenario_{idx}")
-                    os.makedirs(scenario_dir, exist_ok=True)
-                    
-                    st.write(f"**Scenario {idx + 1}:** {scenario.name}")
-                    
-                    with st.spinner(f"Executing scenario..."):
-                        result = run_yaml_scenario(
-                            scenario=scenario.dict(),
-                            base_url=spec.base_url,
-                            out_dir=scenario_dir,
-                            timeout=timeout * 1000,
-                            headless=headless,
-                            auth=(spec.auth.dict() if (spec.auth and spec.auth.enabled) else None)
-                        )
+                    # run_yaml_scenario creates its own out_dir
+                    scenario_jobs.append({
+                        "scenario": scenario.dict(),
+                        "base_url": spec.base_url,
+                        "out_dir": os.path.join(artifacts_dir, f"scenario_{idx}"),
+                        "timeout": timeout * 1000,
+                        "headless": headless,
+                        "auth": scenario_auth
+                    })
+                
+                def show_scenario_result(idx, result):
+                    st.write(f"**Scenario {idx + 1}:** {spec.scenarios[idx].name}")
                     
                     # Display scenario result
                     col1, col2, col3 = st.columns(3)
@@ -979,15 +1992,39 @@ with tab1:
                             for error in result['errors']:
                                 st.error(f"Step {error['step']}: {error['error']}")
                 
+                # Run scenarios
+                workers = min(scenario_parallelism, len(scenario_jobs))
+                if workers > 1:
+                    # Each process owns its own Playwright; results shown as they finish
+                    with st.spinner(f"Executing {len(scenario_jobs)} scenarios ({workers} in parallel)..."):
+                        with ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=multiprocessing.get_context("spawn")
+                        ) as executor:
+                            futures = {
+                                executor.submit(run_scenario_worker, job): idx
+                                for idx, job in enumerate(scenario_jobs)
+                            }
+                            for future in as_completed(futures):
+                                show_scenario_result(futures[future], future.result())
+                else:
+                    pool = get_browser_pool(headless, page_concurrency)
+                    for idx, job in enumerate(scenario_jobs):
+                        with st.spinner(f"Executing scenario..."):
+                            result = pool.submit(run_yaml_scenario, **job).result()
+                        show_scenario_result(idx, result)
+                
                 st.success("✅ All scenarios completed!")
                 st.stop()
             
             elif test_mode == "Stress Test":
+                from app.services.stress_test import create_stress_test_config, run_stress_test
                 # Parse custom actions if provided
                 actions = []
                 if stress_actions.strip():
                     try:
-                        actions = json.loads(stress_actions)
+                        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+                        actions = orjson.loads(stress_actions) if orjson is not None else json.loads(stress_actions)
                         if not isinstance(actions, list):
                             st.error("Custom actions must be a JSON array")
                             st.stop()
@@ -1023,10 +2060,12 @@ with tab1:
                 )
                 update_test_run(run_id, status="running")
                 
-                st.info(f"🚀 Starting stress test on {stress_url}")
-                st.info(f"👥 Concurrent users: {concurrent_users}")
-                st.info(f"⏱️ Duration: {duration_seconds} seconds")
-                st.info(f"📈 Ramp up: {ramp_up_seconds} seconds")
+                st.info("\n\n".join([
+                    f"🚀 Starting stress test on {stress_url}",
+                    f"👥 Concurrent users: {concurrent_users}",
+                    f"⏱️ Duration: {duration_seconds} seconds",
+                    f"📈 Ramp up: {ramp_up_seconds} seconds",
+                ]))
                 
                 # Resource monitoring info
                 if concurrent_users <= 3:
@@ -1066,47 +2105,17 @@ with tab1:
                 # Error analysis
                 if stress_summary.errors:
                     st.subheader("❌ Error Analysis")
-                    error_data = []
-                    for error_type, count in stress_summary.errors.items():
-                        error_data.append({
-                            "Error Type": error_type,
-                            "Count": count,
-                            "Percentage": f"{(count / stress_summary.total_requests * 100):.1f}%"
-                        })
-                    
-                    st.dataframe(error_data, hide_index=True)
+                    st.dataframe(_error_table(stress_summary.errors, stress_summary.total_requests), hide_index=True)
                 
                 # Performance chart
                 st.subheader("📈 Performance Chart")
                 if stress_summary.total_requests > 0:
                     # Create a simple performance visualization
-                    try:
-                        import pandas as pd
-                    except ImportError:
-                        st.warning("⚠️ Pandas tidak tersedia, skip performance chart")
-                        pd = None
-                    
-                    if pd is not None:
-                        # Simulate performance data over time
-                        time_points = list(range(0, int(stress_summary.total_duration), max(1, int(stress_summary.total_duration // 20))))
-                        performance_data = []
-                        
-                        for t in time_points:
-                            # Simulate realistic performance curve
-                            base_rps = stress_summary.requests_per_second
-                            # Add some variation
-                            variation = 0.1 * base_rps * (0.5 - (t % 10) / 10)
-                            rps = max(0, base_rps + variation)
-                            performance_data.append({
-                                "Time (s)": t,
-                                "Requests/sec": rps,
-                                "Response Time (s)": stress_summary.avg_response_time * (1 + 0.1 * (t % 5) / 5)
-                            })
-                        
-                        df = pd.DataFrame(performance_data)
-                        st.line_chart(df.set_index("Time (s)"))
-                    else:
-                        st.info("📊 Performance chart memerlukan pandas. Install dengan: `pip install pandas`")
+                    # Simulate performance data over time
+                    performance_data = _simulated_performance(
+                        stress_summary.total_duration, stress_summary.requests_per_second, stress_summary.avg_response_time
+                    )
+                    st.line_chart(performance_data, x="Time (s)")
                 
                 # Save stress test results
                 stress_results = {
@@ -1136,7 +2145,7 @@ with tab1:
                 }
                 
                 # Generate stress test reports
-                report_paths = generate_stress_test_reports(stress_results, artifacts_dir, run_id)
+                report_paths = _generate_stress_reports(run_id, artifacts_dir, stress_results)
                 
                 # Generate PDF report for stress test
                 with st.spinner("Generating PDF report..."):
@@ -1147,7 +2156,7 @@ with tab1:
                         report_paths['pdf'] = pdf_path
                     except Exception as e:
                         st.warning(f"⚠️ PDF generation failed: {str(e)}")
-                        logger.error(f"PDF generation error: {e}")
+                        logger.error("PDF generation error: %s", e)
                 
                 # Display report links
                 st.subheader("📄 Reports Generated")
@@ -1174,12 +2183,15 @@ with tab1:
                     end_time=datetime.now(),
                     artifacts_path=artifacts_dir
                 )
+                _recent_runs_cached.clear()
                 
                 st.success("✅ Stress test completed!")
                 st.info(f"📁 Results saved to: {artifacts_dir}")
                 st.stop()
             
             elif test_mode == "Load Generator":
+                from app.services.load_generator import AdvancedLoadGenerator, create_load_generator_config
+                from app.services.progress_monitor import create_progress_monitor, create_streamlit_updater
                 # Create load generator configuration
                 load_config = create_load_generator_config(
                     target_url=load_url,
@@ -1219,15 +2231,16 @@ with tab1:
                 )
                 update_test_run(run_id, status="running")
                 
-                st.info(f"🚀 Starting Load Generator: {scenario_name}")
-                st.info(f"👥 Virtual Users: {virtual_users}")
-                st.info(f"⏱️ Duration: {load_duration} seconds")
-                st.info(f"📈 Ramp Up: {ramp_up} seconds")
-                st.info(f"📉 Ramp Down: {ramp_down} seconds")
-                
                 # System capacity info
                 estimated_rps = virtual_users / (think_time + 1) if think_time > 0 else virtual_users
-                st.info(f"🚀 Estimated RPS: {estimated_rps:.1f}")
+                st.info("\n\n".join([
+                    f"🚀 Starting Load Generator: {scenario_name}",
+                    f"👥 Virtual Users: {virtual_users}",
+                    f"⏱️ Duration: {load_duration} seconds",
+                    f"📈 Ramp Up: {ramp_up} seconds",
+                    f"📉 Ramp Down: {ramp_down} seconds",
+                    f"🚀 Estimated RPS: {estimated_rps:.1f}",
+                ]))
                 
                 # Run load test with real-time progress monitoring
                 st.subheader("🚀 Load Test Progress")
@@ -1313,40 +2326,27 @@ with tab1:
                         
                         with tab1:
                             st.subheader("Performance Overview")
-                            try:
-                                import pandas as pd
+                            if chart_data:
+                                # Main performance chart
+                                st.line_chart(chart_data, x='Time (s)')
                                 
-                                df = pd.DataFrame(chart_data)
-                                if not df.empty:
-                                    # Main performance chart
-                                    st.line_chart(df.set_index('Time (s)'))
-                                    
-                                    # Additional metrics
-                                    col1, col2 = st.columns(2)
-                                    with col1:
-                                        st.metric("Peak RPS", f"{summary_stats.get('max_rps', 0):.1f}")
-                                        st.metric("Avg RPS", f"{summary_stats.get('avg_rps', 0):.1f}")
-                                    with col2:
-                                        st.metric("Min Success Rate", f"{summary_stats.get('min_success_rate', 0):.1f}%")
-                                        st.metric("Max Active Users", f"{summary_stats.get('max_active_users', 0)}")
-                                        
-                            except ImportError:
-                                st.info("📊 Performance chart memerlukan pandas. Install dengan: `pip install pandas`")
+                                # Additional metrics
+                                col1, col2 = st.columns(2)
+                                with col1:
+                                    st.metric("Peak RPS", f"{summary_stats.get('max_rps', 0):.1f}")
+                                    st.metric("Avg RPS", f"{summary_stats.get('avg_rps', 0):.1f}")
+                                with col2:
+                                    st.metric("Min Success Rate", f"{summary_stats.get('min_success_rate', 0):.1f}%")
+                                    st.metric("Max Active Users", f"{summary_stats.get('max_active_users', 0)}")
                         
                         with tab2:
                             st.subheader("Detailed Metrics")
-                            try:
-                                import pandas as pd
-                                
-                                df_detailed = pd.DataFrame(detailed_chart_data)
-                                if not df_detailed.empty:
-                                    # Multiple charts for different metrics
-                                    st.line_chart(df_detailed[['RPS', 'Success Rate (%)']].set_index(df_detailed.index))
-                                    st.line_chart(df_detailed[['Active Users', 'Progress (%)']].set_index(df_detailed.index))
-                                    st.line_chart(df_detailed[['Completed Requests', 'Failed Requests']].set_index(df_detailed.index))
-                                    
-                            except ImportError:
-                                st.info("📊 Detailed charts memerlukan pandas")
+                            if detailed_chart_data:
+                                # One chart per group of similarly scaled metrics, all read from the
+                                # same rows via x/y (no per-chart slice + re-index copies)
+                                st.line_chart(detailed_chart_data, x='Time (s)', y=['RPS', 'Success Rate (%)'])
+                                st.line_chart(detailed_chart_data, x='Time (s)', y=['Active Users', 'Progress (%)'])
+                                st.line_chart(detailed_chart_data, x='Time (s)', y=['Completed Requests', 'Failed Requests'])
                         
                         with tab3:
                             st.subheader("Test Summary Statistics")
@@ -1370,15 +2370,14 @@ with tab1:
                                 timeline_data = []
                                 for i, data in enumerate(progress_monitor.get_progress_history()):
                                     timeline_data.append({
-                                        'Time': f"{i}s",
+                                        'Time (s)': i,
                                         'Progress': data['progress_percent'],
                                         'RPS': data['current_rps'],
                                         'Success Rate': data['success_rate']
                                     })
                                 
                                 if timeline_data:
-                                    timeline_df = pd.DataFrame(timeline_data)
-                                    st.dataframe(timeline_df, use_container_width=True)
+                                    st.dataframe(timeline_data, width="stretch")
                 
                 # Display load test results
                 st.subheader("📊 Load Test Results")
@@ -1418,16 +2417,7 @@ with tab1:
                 # Error analysis
                 if load_result.errors:
                     st.subheader("❌ Error Analysis")
-                    error_data = []
-                    for error_type, count in load_result.errors.items():
-                        percentage = (count / load_result.total_requests * 100) if load_result.total_requests > 0 else 0
-                        error_data.append({
-                            "Error Type": error_type,
-                            "Count": count,
-                            "Percentage": f"{percentage:.1f}%"
-                        })
-                    
-                    st.dataframe(error_data, hide_index=True)
+                    st.dataframe(_error_table(load_result.errors, load_result.total_requests), hide_index=True)
                 
                 # System specs
                 st.subheader("🖥️ System Information")
@@ -1439,29 +2429,11 @@ with tab1:
                 # Performance chart
                 st.subheader("📈 Performance Chart")
                 if load_result.total_requests > 0:
-                    try:
-                        import pandas as pd
-                        
-                        # Simulate performance data over time
-                        time_points = list(range(0, int(load_result.duration), max(1, int(load_result.duration // 20))))
-                        performance_data = []
-                        
-                        for t in time_points:
-                            # Simulate realistic performance curve
-                            base_rps = load_result.average_rps
-                            # Add some variation
-                            variation = 0.1 * base_rps * (0.5 - (t % 10) / 10)
-                            rps = max(0, base_rps + variation)
-                            performance_data.append({
-                                "Time (s)": t,
-                                "Requests/sec": rps,
-                                "Response Time (s)": load_result.avg_response_time * (1 + 0.1 * (t % 5) / 5)
-                            })
-                        
-                        df = pd.DataFrame(performance_data)
-                        st.line_chart(df.set_index("Time (s)"))
-                    except ImportError:
-                        st.info("📊 Performance chart memerlukan pandas. Install dengan: `pip install pandas`")
+                    # Simulate performance data over time
+                    performance_data = _simulated_performance(
+                        load_result.duration, load_result.average_rps, load_result.avg_response_time
+                    )
+                    st.line_chart(performance_data, x="Time (s)")
                 
                 # Save load test results
                 load_results = {
@@ -1510,8 +2482,12 @@ with tab1:
                 
                 # Save to artifacts
                 load_results_path = os.path.join(artifacts_dir, "load_test_results.json")
-                with open(load_results_path, 'w', encoding='utf-8') as f:
-                    json.dump(load_results, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    Path(load_results_path).write_bytes(orjson.dumps(load_results, option=orjson.OPT_INDENT_2))
+                else:
+                    Path(load_results_path).write_bytes(
+                        json.dumps(load_results, indent=2, ensure_ascii=False).encode('utf-8')
+                    )
                 
                 # Update database
                 update_test_run(
@@ -1523,14 +2499,37 @@ with tab1:
                     end_time=datetime.now(),
                     artifacts_path=artifacts_dir
                 )
+                _recent_runs_cached.clear()
                 
                 st.success("✅ Load test completed!")
-                st.info(f"📁 Results saved to: {artifacts_dir}")
-                st.info(f"🎭 Scenario: {scenario_name}")
-                st.info(f"📋 Test Plan: {test_plan_name}")
+                st.info("\n\n".join([
+                    f"📁 Results saved to: {artifacts_dir}",
+                    f"🎭 Scenario: {scenario_name}",
+                    f"📋 Test Plan: {test_plan_name}",
+                ]))
                 st.stop()
             
             else:  # Single Page
+                if not save_artifacts:
+                    from app.runners.playwright_runner import run_page_smoke_fast
+                    from app.services.browser_pool import get_browser_pool
+                    # Quick check: minimal smoke test, nothing written to disk or DB
+                    with st.spinner(f"Checking {test_url}..."):
+                        result = get_browser_pool(headless, page_concurrency).submit(
+                            run_page_smoke_fast,
+                            test_url,
+                            timeout=timeout * 1000,
+                            auth=auth_config
+                        ).result()
+                    
+                    st.subheader("⚡ Quick Check")
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("Status", result['status'])
+                    col2.metric("HTTP", result.get('http_status') or "N/A")
+                    col3.metric("Load Time", f"{result['load_ms']}ms" if result['load_ms'] else "N/A")
+                    st.json(result)
+                    st.stop()
+                
                 urls_to_test = [test_url]
                 
                 # Create database record
@@ -1543,466 +2542,137 @@ with tab1:
             
             # Test each page
             if urls_to_test:
+                from app.runners.playwright_runner import run_page_smoke
+                from app.services.browser_pool import get_browser_pool
+                from app.services.result_cache import result_cache_key, get_cached_result, store_result, restore_cached_artifacts
                 st.subheader(f"🧪 Testing {len(urls_to_test)} page(s)")
                 
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                for idx, url in enumerate(urls_to_test):
-                    status_text.text(f"Testing: {url}")
-                    
-                    # Create page directory
-                    page_dir = os.path.join(artifacts_dir, f"page_{idx:04d}")
-                    os.makedirs(page_dir, exist_ok=True)
-                    
-                    # Run smoke test
-                    form_safe_mode_value = st.session_state.get("form_safe_mode", True)
-                    logger.info(f"Form safe mode from session state: {form_safe_mode_value}")
-                    
-                    result = run_page_smoke(
-                        url=url,
-                        out_dir=page_dir,
-                        timeout=timeout * 1000,
-                        headless=headless,
-                        deep_component_test=deep_component_test,
-                        test_forms=test_forms,
-                        form_safe_mode=form_safe_mode_value,
-                        auth=auth_config,
-                        enable_xss_test=enable_xss_test,
-                        enable_sql_test=enable_sql_test
-                    )
-                    
-                    # Form testing is now handled in run_page_smoke with test_forms parameter
-                    
-                    results.append(result)
-                    
-                    # Save to database
-                    create_page_test(run_id, url, result)
-                    
-                    # Update progress
-                    progress = (idx + 1) / len(urls_to_test)
-                    progress_bar.progress(progress)
+                form_safe_mode_value = st.session_state.get("form_safe_mode", True)
+                logger.info("Form safe mode from session state: %s", form_safe_mode_value)
+                
+                # Page directories are created below, and only for pages that run
+                page_jobs = [
+                    (url, os.path.join(artifacts_dir, f"page_{idx:04d}"))
+                    for idx, url in enumerate(urls_to_test)
+                ]
+                
+                smoke_options = {
+                    "timeout": timeout * 1000,
+                    "headless": headless,
+                    "deep_component_test": deep_component_test,
+                    "test_forms": test_forms,
+                    "form_safe_mode": form_safe_mode_value,
+                    "auth": auth_config,
+                    "enable_xss_test": enable_xss_test,
+                    "enable_sql_test": enable_sql_test,
+                    "full_page_screenshot": full_page_screenshot,
+                    "screenshot_quality": screenshot_quality
+                }
+                page_results = [None] * len(urls_to_test)
+                # ~20 progress updates per run at most (each one is a websocket frame)
+                update_every = max(1, len(urls_to_test) // 20)
+                
+                # Opt-in: reuse cached results for the same URL + options; the cached
+                # artifacts are brought into this run's page directory
+                cache_keys = [result_cache_key(url, **smoke_options) for url, _ in page_jobs]
+                cache_hits = 0
+                if use_result_cache:
+                    for idx, key in enumerate(cache_keys):
+                        cached = get_cached_result(key)
+                        if cached is not None:
+                            page_results[idx] = restore_cached_artifacts(cached, page_jobs[idx][1])
+                            cache_hits += page_results[idx] is not None
+                if cache_hits:
+                    st.info(f"♻️ Reusing {cache_hits} cached page result(s)")
+                
+                # Pages run in parallel on the shared browser pool, each page in its own
+                # context; form testing is handled in run_page_smoke with test_forms parameter
+                # Create the page directories in one pass before dispatching; artifacts_dir
+                # is brand new, so a plain mkdir per page is enough
+                for idx, (_, page_dir) in enumerate(page_jobs):
+                    if page_results[idx] is None:
+                        os.mkdir(page_dir)
+                
+                pool = get_browser_pool(headless, page_concurrency)
+                futures = {
+                    pool.submit(run_page_smoke, url=url, out_dir=page_dir, **smoke_options): idx
+                    for idx, (url, page_dir) in enumerate(page_jobs)
+                    if page_results[idx] is None
+                }
+                if not futures:
+                    progress_bar.progress(1.0)
+                try:
+                    for done, future in enumerate(as_completed(futures), start=cache_hits + 1):
+                        idx = futures[future]
+                        result = future.result()
+                        page_results[idx] = result
+                        store_result(cache_keys[idx], result, page_jobs[idx][1])
+                        
+                        # Update progress every ~5% of pages (always on the last page)
+                        if done % update_every == 0 or done == len(urls_to_test):
+                            status_text.text(f"Tested: {result['url']}")
+                            progress_bar.progress(done / len(urls_to_test))
+                finally:
+                    # Drop queued pages if the run aborted midway
+                    for future in futures:
+                        future.cancel()
+                
+                # Saved in one bulk insert, in crawl order
+                create_page_tests_bulk(run_id, [
+                    (result['url'], result, page_dir)
+                    for result, (_, page_dir) in zip(page_results, page_jobs)
+                ])
+                
+                # Keep results in crawl order regardless of completion order
+                results.extend(page_results)
                 
                 status_text.text("✅ Testing complete!")
                 
-                # Update database
-                passed_count = sum(1 for r in results if r['status'] == 'PASS')
+                # Aggregate summary numbers in one pass
+                passed_count = total_console_errors = total_network_fails = 0
+                load_sum = load_count = 0
+                # Indices of pages that have data for each detail section
+                detail_pages = {'component_tests': [], 'form_test': [], 'pentest': [], 'errors': []}
+                # Expander/selectbox labels, truncated once instead of on every rerun
+                short_urls = []
+                for idx, r in enumerate(results):
+                    short_urls.append(r.get('url', 'Unknown URL')[:80])
+                    passed_count += r['status'] == 'PASS'
+                    total_console_errors += len(r.get('console_errors', ()))
+                    total_network_fails += len(r.get('network_failures', ()))
+                    load_ms = r.get('load_ms')
+                    if load_ms:
+                        load_sum += load_ms
+                        load_count += 1
+                    if 'component_tests' in r:
+                        detail_pages['component_tests'].append(idx)
+                    if r.get('form_test') or r.get('form_test_error'):
+                        detail_pages['form_test'].append(idx)
+                    if r.get('xss_test') or r.get('sql_test'):
+                        detail_pages['pentest'].append(idx)
+                    if r['status'] == 'ERROR' and r.get('error'):
+                        detail_pages['errors'].append(idx)
                 failed_count = len(results) - passed_count
+                avg_load = load_sum // load_count if load_count else 0
                 
+                # Update database
+                end_time = datetime.now()
                 update_test_run(
                     run_id,
                     status="completed",
                     total_pages=len(results),
                     passed=passed_count,
                     failed=failed_count,
-                    end_time=datetime.now(),
+                    end_time=end_time,
                     artifacts_path=artifacts_dir
                 )
-                
-                # Display summary metrics
-                st.subheader("📈 Summary")
-                
-                col1, col2, col3, col4, col5 = st.columns(5)
-                
-                total_console_errors = sum(len(r.get('console_errors', [])) for r in results)
-                total_network_fails = sum(len(r.get('network_failures', [])) for r in results)
-                load_times = [r['load_ms'] for r in results if r.get('load_ms')]
-                avg_load = int(sum(load_times) / len(load_times)) if load_times else 0
-                pass_rate = int((passed_count / len(results) * 100)) if results else 0
-                
-                col1.metric("Total Pages", len(results))
-                col2.metric("Passed", passed_count, delta=f"{pass_rate}%")
-                col3.metric("Failed", failed_count)
-                col4.metric("Console Errors", total_console_errors)
-                col5.metric("Avg Load Time", f"{avg_load}ms")
-                
-                # Results table
-                st.subheader("📋 Detailed Results")
-                
-                # Prepare data for display
-                display_data = []
-                for r in results:
-                    assertions = r.get('assertions', [])
-                    assertions_passed = sum(1 for a in assertions if a.get('pass'))
-                    
-                    display_data.append({
-                        'URL': r['url'],
-                        'Status': r['status'],
-                        'HTTP': r.get('http_status', 'N/A'),
-                        'Load (ms)': r.get('load_ms', 'N/A'),
-                        'Console Errors': len(r.get('console_errors', [])),
-                        'Network Fails': len(r.get('network_failures', [])),
-                        'Assertions': f"{assertions_passed}/{len(assertions)}",
-                        'Forms': r.get('forms_found', 0)
-                    })
-                
-                st.dataframe(
-                    display_data,
-                    width="stretch",
-                    hide_index=True
-                )
-                
-                # Show error messages if any
-                errors_found = [r for r in results if r.get('status') == 'ERROR' and r.get('error')]
-                if errors_found:
-                    st.error("⚠️ **Errors Detected:**")
-                    for r in errors_found:
-                        with st.expander(f"❌ Error for {r['url'][:60]}..."):
-                            st.code(r.get('error', 'Unknown error'), language="text")
-                
-                # Display Component Test Results (if enabled)
-                if deep_component_test and results and results[0].get('component_tests'):
-                    st.subheader("🔍 Detailed Component Analysis")
-                    
-                    for idx, r in enumerate(results):
-                        if 'component_tests' in r:
-                            comp = r['component_tests']
-                            summary = comp.get('summary', {})
-                            
-                            with st.expander(f"📄 {r['url'][:80]}... - Component Details"):
-                                # Summary metrics
-                                col1, col2, col3, col4 = st.columns(4)
-                                
-                                col1.metric(
-                                    "Buttons",
-                                    f"{summary.get('working_buttons', 0)}/{summary.get('total_buttons', 0)}",
-                                    delta="Working"
-                                )
-                                col2.metric(
-                                    "Images",
-                                    f"{summary.get('loaded_images', 0)}/{summary.get('total_images', 0)}",
-                                    delta=f"{summary.get('broken_images', 0)} broken" if summary.get('broken_images', 0) > 0 else "All OK",
-                                    delta_color="inverse" if summary.get('broken_images', 0) > 0 else "normal"
-                                )
-                                col3.metric(
-                                    "Links",
-                                    summary.get('valid_links', 0),
-                                    delta="Valid"
-                                )
-                                col4.metric(
-                                    "Forms",
-                                    f"{summary.get('complete_forms', 0)}/{summary.get('total_forms', 0)}",
-                                    delta="Complete"
-                                )
-                                
-                                # Detailed tabs
-                                tab_btn, tab_img, tab_link, tab_form = st.tabs(["Buttons", "Images", "Links", "Forms"])
-                                
-                                with tab_btn:
-                                    buttons = comp.get('buttons', {})
-                                    st.write(f"**Total Buttons:** {buttons.get('total_buttons', 0)}")
-                                    st.write(f"**Clickable:** {buttons.get('clickable_buttons', 0)}")
-                                    st.write(f"**Disabled:** {buttons.get('disabled_buttons', 0)}")
-                                    st.write(f"**Hidden:** {buttons.get('hidden_buttons', 0)}")
-                                    
-                                    if buttons.get('buttons_tested'):
-                                        btn_data = [{
-                                            "Text": b.get('text', 'N/A'),
-                                            "Status": b.get('status', 'N/A'),
-                                            "Visible": b.get('visible', False),
-                                            "Enabled": b.get('enabled', False)
-                                        } for b in buttons['buttons_tested'][:20]]
-                                        st.dataframe(btn_data, width="stretch")
-                                
-                                with tab_img:
-                                    images = comp.get('images', {})
-                                    st.write(f"**Total Images:** {images.get('total_images', 0)}")
-                                    st.write(f"**Loaded:** {images.get('loaded_images', 0)}")
-                                    st.write(f"**Broken:** {images.get('broken_images', 0)}")
-                                    st.write(f"**Without Alt:** {images.get('images_without_alt', 0)}")
-                                    
-                                    if images.get('images_tested'):
-                                        img_data = [{
-                                            "Source": i.get('src', 'N/A')[:50],
-                                            "Alt": i.get('alt', 'N/A'),
-                                            "Size": f"{i.get('width', 0)}x{i.get('height', 0)}",
-                                            "Status": i.get('status', 'N/A')
-                                        } for i in images['images_tested'][:20]]
-                                        st.dataframe(img_data, width="stretch")
-                                
-                                with tab_link:
-                                    links = comp.get('links', {})
-                                    st.write(f"**Total Links:** {links.get('total_links', 0)}")
-                                    st.write(f"**Valid Links:** {links.get('valid_links', 0)}")
-                                    st.write(f"**Empty Links:** {links.get('empty_links', 0)}")
-                                    st.write(f"**External:** {links.get('external_links', 0)}")
-                                    st.write(f"**Internal:** {links.get('internal_links', 0)}")
-                                    
-                                    if links.get('links_tested'):
-                                        link_data = [{
-                                            "Text": l.get('text', 'N/A'),
-                                            "Href": l.get('href', 'N/A')[:50],
-                                            "Type": l.get('type', 'N/A'),
-                                            "Status": l.get('status', 'N/A')
-                                        } for l in links['links_tested'][:20]]
-                                        st.dataframe(link_data, width="stretch")
-                                
-                                with tab_form:
-                                    forms = comp.get('forms', {})
-                                    st.write(f"**Total Forms:** {forms.get('total_forms', 0)}")
-                                    st.write(f"**With Action:** {forms.get('forms_with_action', 0)}")
-                                    st.write(f"**With Submit Button:** {forms.get('forms_with_submit', 0)}")
-                                    
-                                    if forms.get('forms_tested'):
-                                        for form_idx, form in enumerate(forms['forms_tested']):
-                                            st.write(f"**Form {form_idx + 1}:**")
-                                            st.write(f"- Action: `{form.get('action', 'N/A')}`")
-                                            st.write(f"- Method: `{form.get('method', 'GET')}`")
-                                            st.write(f"- Inputs: {form.get('input_count', 0)}")
-                                            st.write(f"- Status: {form.get('status', 'N/A')}")
-                                            
-                                            if form.get('inputs'):
-                                                input_data = [{
-                                                    "Name": inp.get('name', 'N/A'),
-                                                    "Type": inp.get('type', 'N/A')
-                                                } for inp in form['inputs']]
-                                                st.dataframe(input_data, width="stretch")
-                                            st.divider()
-                
-                # Display Form Testing Results (if enabled)
-                if test_forms and results:
-                    st.subheader("📋 Form Testing Results")
-                    
-                    for idx, r in enumerate(results):
-                        if 'form_test' in r and r['form_test']:
-                            form_test = r['form_test']
-                            
-                            # Validate form_test structure
-                            if not isinstance(form_test, dict):
-                                st.error(f"❌ Invalid form test data structure for {r.get('url', 'Unknown URL')}")
-                                continue
-                            
-                            with st.expander(f"📝 Form Test Results - {r.get('url', 'Unknown URL')[:80]}..."):
-                                # Form test summary
-                                col1, col2, col3 = st.columns(3)
-                                
-                                # Safe access to form_test properties
-                                success = form_test.get('success', False) if isinstance(form_test.get('success'), bool) else False
-                                
-                                col1.metric(
-                                    "Form Test Status",
-                                    "✅ Success" if success else "❌ Failed",
-                                    delta="Success" if success else "Failed"
-                                )
-                                
-                                # Safe access to fill_result
-                                fill_result = form_test.get('fill_result')
-                                if fill_result is None or not isinstance(fill_result, dict):
-                                    fill_result = {}
-                                
-                                fields_filled = fill_result.get('fields_filled', 0) if isinstance(fill_result.get('fields_filled'), int) else 0
-                                fields_failed = fill_result.get('fields_failed', 0) if isinstance(fill_result.get('fields_failed'), int) else 0
-                                
-                                col2.metric(
-                                    "Fields Filled",
-                                    fields_filled,
-                                    delta=f"{fields_failed} failed" if fields_failed > 0 else "All OK"
-                                )
-                                
-                                submitted = form_test.get('submitted', False) if isinstance(form_test.get('submitted'), bool) else False
-                                col3.metric(
-                                    "Form Submitted",
-                                    "✅ Yes" if submitted else "❌ No",
-                                    delta="Submitted" if submitted else "Not Submitted"
-                                )
-                                
-                                # Form test details
-                                st.write("**Form Test Details:**")
-                                
-                                # Safe Mode indicator
-                                safe_mode = form_test.get('safe_mode', False)
-                                if safe_mode:
-                                    auto_safe_mode = form_test.get('auto_safe_mode', False)
-                                    if auto_safe_mode:
-                                        st.warning("🛡️ **Auto-Safe Mode Active** - Form filled without submission to preserve session (automatic protection)")
-                                    else:
-                                        st.info("🛡️ **Safe Mode Active** - Form filled without submission to preserve session")
-                                    
-                                    safe_mode_reason = form_test.get('safe_mode_reason')
-                                    if safe_mode_reason:
-                                        st.write(f"**Reason:** {safe_mode_reason}")
-                                
-                                    # Show detailed safe mode information
-                                    message = form_test.get('message')
-                                    if message:
-                                        st.write(f"**Message:** {message}")
-                                
-                                # Session timeout information
-                                session_timeout_info = form_test.get('session_timeout_info')
-                                if session_timeout_info and isinstance(session_timeout_info, dict):
-                                    has_timeout = session_timeout_info.get('has_timeout', False)
-                                    if has_timeout:
-                                        timeout_minutes = session_timeout_info.get('timeout_minutes', 'N/A')
-                                        st.warning(f"⏰ **Session Timeout Detected:** {timeout_minutes} minutes")
-                                        
-                                        warnings = session_timeout_info.get('warnings')
-                                        if warnings and isinstance(warnings, list):
-                                            for warning in warnings:
-                                                if isinstance(warning, str):
-                                                    st.warning(f"⚠️ {warning}")
-                                
-                                # Session recovery information
-                                session_restored = form_test.get('session_restored', False)
-                                if session_restored:
-                                    session_recovery_success = form_test.get('session_recovery_success', False)
-                                    if session_recovery_success:
-                                        st.success("🔄 **Session Recovery Successful** - User returned to authenticated state")
-                                    else:
-                                        st.error("❌ **Session Recovery Failed** - Still on login page")
-                                
-                                # Redirect analysis
-                                redirect_analysis = form_test.get('redirect_analysis')
-                                if redirect_analysis and isinstance(redirect_analysis, dict):
-                                    st.write("**🔍 Redirect Analysis:**")
-                                    redirect_cause = redirect_analysis.get('redirect_cause', 'Unknown')
-                                    st.write(f"**Cause:** {redirect_cause}")
-                                    
-                                    error_messages = redirect_analysis.get('error_messages')
-                                    if error_messages and isinstance(error_messages, list):
-                                        st.write("**Error Messages Found:**")
-                                        for error in error_messages[:3]:  # Show first 3
-                                            if isinstance(error, dict):
-                                                error_text = error.get('text', 'N/A')
-                                                st.write(f"- {error_text}")
-                                    
-                                    recommendations = redirect_analysis.get('recommendations')
-                                    if recommendations and isinstance(recommendations, list):
-                                        st.write("**💡 Recommendations:**")
-                                        for rec in recommendations:
-                                            if isinstance(rec, str):
-                                                st.write(f"- {rec}")
-                                
-                                # CSRF Token Support
-                                csrf_tokens_found = form_test.get('csrf_tokens_found', 0)
-                                if isinstance(csrf_tokens_found, (int, float)) and csrf_tokens_found > 0:
-                                    st.success(f"🔐 **CSRF Protection:** {csrf_tokens_found} token(s) found")
-                                    csrf_token_added = form_test.get('csrf_token_added', False)
-                                    if csrf_token_added:
-                                        st.info("🔐 **CSRF Token Added** - Token automatically added to form")
-                                
-                                # Success/Error indicators
-                                has_success_message = form_test.get('has_success_message', False)
-                                if has_success_message:
-                                    st.success("✅ Success message detected on page")
-                                
-                                has_error_message = form_test.get('has_error_message', False)
-                                if has_error_message:
-                                    st.error("❌ Error message detected on page")
-                                
-                                # URL change
-                                url_changed = form_test.get('url_changed', False)
-                                if url_changed:
-                                    st.info("🔄 URL changed after form submission")
-                                
-                                # Validation errors
-                                form_validation_errors = form_test.get('form_validation_errors')
-                                if form_validation_errors and isinstance(form_validation_errors, list):
-                                    st.error("⚠️ Form validation errors detected:")
-                                    for error in form_validation_errors:
-                                        if isinstance(error, dict):
-                                            error_text = error.get('text', 'N/A')
-                                            st.write(f"- {error_text}")
-                                
-                                # Network errors
-                                network_errors = form_test.get('network_errors')
-                                if network_errors and isinstance(network_errors, list):
-                                    st.error("🌐 Network errors during form submission:")
-                                    for error in network_errors:
-                                        if isinstance(error, dict):
-                                            error_url = error.get('url', 'N/A')
-                                            error_failure = error.get('failure', 'N/A')
-                                            st.write(f"- {error_url}: {error_failure}")
-                                
-                                # Screenshot evidence
-                                st.write("**📸 Screenshot Evidence:**")
-                                
-                                screenshot_before = form_test.get('screenshot_before_path')
-                                screenshot_after = form_test.get('screenshot_after_path')
-                                
-                                if screenshot_before and isinstance(screenshot_before, str) and os.path.exists(screenshot_before):
-                                    st.write("**Before Form Submission:**")
-                                    st.image(screenshot_before, caption="Form before submission", width="stretch")
-                                
-                                if screenshot_after and isinstance(screenshot_after, str) and os.path.exists(screenshot_after):
-                                    safe_mode = form_test.get('safe_mode', False)
-                                    if safe_mode:
-                                        st.write("**After Form Filling (Safe Mode):**")
-                                        st.image(screenshot_after, caption="Form after filling (submission skipped)", width="stretch")
-                                    else:
-                                        st.write("**After Form Submission:**")
-                                        st.image(screenshot_after, caption="Form after submission", width="stretch")
-                                
-                                # Form test errors
-                                form_test_errors = form_test.get('errors')
-                                if form_test_errors and isinstance(form_test_errors, list):
-                                    st.error("**Form Test Errors:**")
-                                    for error in form_test_errors:
-                                        if isinstance(error, str):
-                                            st.write(f"- {error}")
-                                
-                                st.divider()
-                        
-                        # Handle form test errors (when form_test is None but form_test_error exists)
-                        elif 'form_test_error' in r and r['form_test_error']:
-                            form_test_error = r['form_test_error']
-                            
-                            with st.expander(f"❌ Form Test Error - {r.get('url', 'Unknown URL')[:80]}..."):
-                                st.error(f"**Form Test Failed:** {form_test_error}")
-                                st.info("Form testing encountered an error. This could be due to:")
-                                st.write("- No forms found on the page")
-                                st.write("- Form elements not accessible")
-                                st.write("- Page structure issues")
-                                st.write("- Network or timeout errors")
-                                st.divider()
-                
-                # Display Penetration Testing Results
-                if (enable_xss_test or enable_sql_test) and results:
-                    st.subheader("🔒 Penetration Testing Results")
-                    
-                    for idx, r in enumerate(results):
-                        pentest_results = []
-                        
-                        # XSS Test Results
-                        if 'xss_test' in r and r['xss_test']:
-                            xss_test = r['xss_test']
-                            pentest_results.append(('XSS', xss_test))
-                        
-                        # SQL Test Results  
-                        if 'sql_test' in r and r['sql_test']:
-                            sql_test = r['sql_test']
-                            pentest_results.append(('SQL Injection', sql_test))
-                        
-                        if pentest_results:
-                            with st.expander(f"🔒 Penetration Test Results - {r['url'][:80]}..."):
-                                for test_type, test_data in pentest_results:
-                                    st.write(f"**{test_type} Testing:**")
-                                    
-                                    summary = test_data.get('summary', {})
-                                    vulnerabilities = summary.get('vulnerabilities_found', 0)
-                                    
-                                    if vulnerabilities > 0:
-                                        st.error(f"🚨 **{vulnerabilities} vulnerabilities found!**")
-                                        
-                                        # Show detailed results
-                                        form_tests = test_data.get('form_tests', [])
-                                        for test in form_tests:
-                                            if test.get('is_vulnerable'):
-                                                st.write(f"**Input:** {test.get('input_name', 'N/A')}")
-                                                st.write(f"**Payload:** `{test.get('payload', 'N/A')}`")
-                                                st.write(f"**Risk Level:** {test.get('risk_level', 'N/A')}")
-                                                if test.get('response_snippet'):
-                                                    st.write(f"**Response:** {test.get('response_snippet', '')[:200]}...")
-                                                st.divider()
-                                    else:
-                                        st.success(f"✅ No {test_type} vulnerabilities found")
-                                    
-                                    st.divider()
+                _recent_runs_cached.clear()
                 
                 # Generate reports
-                st.subheader("📄 Export Reports")
-                
-                with st.spinner("Generating reports..."):
-                    report_paths = generate_all_reports(results, artifacts_dir, run_id)
+                report_paths = _generate_reports(run_id, artifacts_dir, results)
                 
                 # Generate PDF report
                 with st.spinner("Generating PDF report..."):
@@ -2035,7 +2705,7 @@ with tab1:
                             "error_pages": len([r for r in results if r.get('status') == 'error']),
                             "page_results": results,
                             "start_time": start_time,
-                            "end_time": datetime.now(),
+                            "end_time": end_time,
                             "headless": headless,
                             "timeout": timeout,
                             "max_depth": max_depth if test_mode == "Crawler Mode" else None,
@@ -2047,66 +2717,38 @@ with tab1:
                         report_paths['pdf'] = pdf_path
                     except Exception as e:
                         st.warning(f"⚠️ PDF generation failed: {str(e)}")
-                        logger.error(f"PDF generation error: {e}")
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                # HTML Report
-                with col1:
-                    with open(report_paths['html'], 'rb') as f:
-                        st.download_button(
-                            "📊 Download HTML",
-                            f.read(),
-                            file_name=f"report_{run_id}.html",
-                            mime="text/html"
-                        )
-                
-                # CSV Report
-                with col2:
-                    with open(report_paths['csv'], 'rb') as f:
-                        st.download_button(
-                            "📈 Download CSV",
-                            f.read(),
-                            file_name=f"report_{run_id}.csv",
-                            mime="text/csv"
-                        )
-                
-                # JSON Report
-                with col3:
-                    with open(report_paths['json'], 'rb') as f:
-                        st.download_button(
-                            "🔧 Download JSON",
-                            f.read(),
-                            file_name=f"report_{run_id}.json",
-                            mime="application/json"
-                        )
-                
-                # PDF Report
-                with col4:
-                    if 'pdf' in report_paths and os.path.exists(report_paths['pdf']):
-                        with open(report_paths['pdf'], 'rb') as f:
-                            st.download_button(
-                                "📄 Download PDF",
-                                f.read(),
-                                file_name=f"report_{run_id}.pdf",
-                                mime="application/pdf"
-                            )
-                    else:
-                        st.error("❌ PDF not available")
-                
-                st.success(f"✅ Reports saved to: `{artifacts_dir}`")
-                
-                # View HTML report inline
-                with st.expander("👁️ Preview HTML Report"):
-                    with open(report_paths['html'], 'r', encoding='utf-8') as f:
-                        st.components.v1.html(f.read(), height=600, scrolling=True)
+                        logger.error("PDF generation error: %s", e)
+                
+                # Keep the results view across reruns (toggles, downloads, sidebar edits)
+                st.session_state.last_run_view = {
+                    'run_id': run_id,
+                    'artifacts_dir': artifacts_dir,
+                    'results': results,
+                    'report_paths': report_paths,
+                    'passed_count': passed_count,
+                    'failed_count': failed_count,
+                    'total_console_errors': total_console_errors,
+                    'total_network_fails': total_network_fails,
+                    'avg_load': avg_load,
+                    'detail_pages': detail_pages,
+                    'short_urls': short_urls,
+                    'deep_component_test': deep_component_test,
+                    'test_forms': test_forms,
+                    'enable_xss_test': enable_xss_test,
+                    'enable_sql_test': enable_sql_test
+                }
+                render_page_results(st.session_state.last_run_view)
         
         except Exception as e:
             st.error(f"❌ Error during test execution: {str(e)}")
-            logger.error(f"Test execution error: {e}", exc_info=True)
+            logger.error("Test execution error: %s", e, exc_info=True)
             
             if 'run_id' in locals():
                 update_test_run(run_id, status="failed")
+                _recent_runs_cached.clear()
+    
+    elif st.session_state.get("last_run_view"):
+        render_page_results(st.session_state.last_run_view)
     
     else:
         # Show placeholder
@@ -2130,73 +2772,67 @@ with tab1:
 with tab2:
     st.subheader("📜 Test History")
     
-    recent_runs = get_recent_runs(limit=20)
+    recent_runs = _recent_runs_cached(20)
     
     if recent_runs:
-        history_data = []
-        for run in recent_runs:
-            duration = ""
-            if run.end_time:
-                delta = run.end_time - run.start_time
-                duration = f"{delta.total_seconds():.1f}s"
-            
-            history_data.append({
-                'Run ID': run.run_id,
-                'Base URL': run.base_url,
-                'Status': run.status,
-                'Pages': run.total_pages,
-                'Passed': run.passed,
-                'Failed': run.failed,
-                'Duration': duration,
-                'Started': run.start_time.strftime("%Y-%m-%d %H:%M")
-            })
+        import pandas as pd
+        
+        runs = pd.DataFrame.from_records(recent_runs)
+        start = pd.to_datetime(runs['start_time'])
+        end = pd.to_datetime(runs['end_time'])
+        seconds = (end - start).dt.total_seconds().round(1)
+        history = pd.DataFrame({
+            'Run ID': runs['run_id'],
+            'Base URL': runs['base_url'],
+            'Status': runs['status'],
+            'Pages': runs['total_pages'],
+            'Passed': runs['passed'],
+            'Failed': runs['failed'],
+            'Duration': seconds.map('{:.1f}s'.format).where(end.notna(), ''),
+            'Started': start.dt.strftime("%Y-%m-%d %H:%M"),
+        })
         
-        st.dataframe(history_data, width="stretch", hide_index=True)
+        st.dataframe(history, width="stretch", hide_index=True)
+        
+        # Drill-down: a page's full result is read from its artifacts only once it is picked
+        history_run = st.selectbox(
+            "Run details",
+            runs['run_id'],
+            index=None,
+            placeholder="Select a run to inspect its pages",
+            key="history_run"
+        )
+        if history_run:
+            pages = _page_tests_cached(history_run)
+            if pages:
+                page_idx = st.selectbox(
+                    "Page",
+                    range(len(pages)),
+                    index=None,
+                    format_func=lambda i: f"{pages[i]['status']} · {pages[i]['url'][:80]}",
+                    placeholder="Select a page to load its full result",
+                    key=f"history_page_{history_run}"
+                )
+                if page_idx is not None:
+                    details = _page_details(pages[page_idx])
+                    if details is None:
+                        st.warning("⚠️ Full result not available (artifacts were removed or not saved)")
+                    else:
+                        st.json(details, expanded=1)
+            else:
+                st.info("No page results stored for this run")
     else:
         st.info("No test history yet. Run your first test!")
 
 with tab3:
     st.subheader("ℹ️ About Black-Box Testing Tool")
     
-    st.markdown("""
-    ### Features
-    
-    - 🕷️ **Automatic Crawling**: Discover pages automatically with depth and pattern control
-    - 🧪 **Smoke Testing**: Load time, HTTP status, console errors, network failures
-    - ✅ **Assertions**: Title, heading, meta tags, broken images
-    - 📋 **Form Testing**: Auto-detect and test forms (experimental)
-    - 📝 **YAML Scenarios**: Custom test workflows with actions and assertions
-    - 📊 **Rich Reports**: HTML, CSV, and JSON export formats
-    - 💾 **Test History**: Track all test runs in SQLite database
-    - 📸 **Screenshots**: Capture full-page screenshots for evidence
-    
-    ### Technologies
-    
-    - **Playwright**: Modern browser automation
-    - **Streamlit**: Interactive web UI
-    - **SQLModel**: Database ORM
-    - **Jinja2**: HTML report templating
-    - **Beautiful Soup**: HTML parsing for crawler
-    
-    ### Limitations
-    
-    - ⚠️ Cannot bypass CAPTCHA or authentication
-    - ⚠️ Limited support for SPAs with heavy JavaScript
-    - ⚠️ Form testing is experimental
-    
-    ### Version
-    
-    **v1.0.0** - Initial Release
-    
-    ---
-    
-    Made with ❤️ using Playwright and Streamlit
-    """)
+    st.markdown(_about_md())
 
 # Footer
 st.divider()
 st.markdown(
-    '<div style="text-align: center; color: #666; font-size: 0.9rem;">Black-Box Testing Tool v1.0 | Powered by Playwright</div>',
+    FOOTER_HTML,
     unsafe_allow_html=True
 )
 
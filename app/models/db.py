@@ -1,7 +1,8 @@
 """Database models using SQLModel."""
 
 from sqlmodel import SQLModel, Field, create_engine, Session, select
-from typing import Optional, List
+from sqlalchemy import event, inspect, text
+from typing import Optional, List, Tuple
 from datetime import datetime
 import json
 import os
@@ -36,7 +37,8 @@ class PageTest(SQLModel, table=True):
     assertions_total: int = 0
     forms_found: int = 0
     screenshot_path: Optional[str] = None
-    result_json: Optional[str] = None  # Full result as JSON
+    result_json: Optional[str] = None  # Legacy: full result as JSON (no longer written)
+    artifact_path: Optional[str] = None  # Page artifact dir holding the full result.json.gz
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
@@ -45,9 +47,25 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test_runs.db")
 engine = create_engine(DATABASE_URL, echo=False)
 
 
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL + NORMAL sync so commits don't fsync the whole journal."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 def init_db():
     """Initialize database tables."""
     SQLModel.metadata.create_all(engine)
+    
+    # Columns added after the first release; create_all doesn't alter existing tables
+    existing = {c["name"] for c in inspect(engine).get_columns("pagetest")}
+    if "artifact_path" not in existing:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE pagetest ADD COLUMN artifact_path VARCHAR"))
 
 
 def get_session() -> Session:
@@ -117,23 +135,69 @@ def update_test_run(
 def create_page_test(
     run_id: str,
     url: str,
-    result: dict
+    result: dict,
+    artifact_path: Optional[str] = None
 ) -> PageTest:
     """
     Create page test record.
     
+    Only summary columns are stored; the full result stays on disk under
+    artifact_path.
+    
     Args:
         run_id: Associated run ID
         url: Page URL
         result: Test result dictionary
+        artifact_path: Page artifact directory (optional)
         
     Returns:
         Created PageTest object
     """
+    page_test = _build_page_test(run_id, url, result, artifact_path)
+    
+    with get_session() as session:
+        session.add(page_test)
+        session.commit()
+        session.refresh(page_test)
+    
+    return page_test
+
+
+def create_page_tests_bulk(
+    run_id: str,
+    rows: List[Tuple[str, dict, Optional[str]]]
+) -> int:
+    """
+    Create many page test records with a single executemany in one transaction.
+    
+    Args:
+        run_id: Associated run ID
+        rows: List of (url, result, artifact_path) tuples
+        
+    Returns:
+        Number of records created
+    """
+    if not rows:
+        return 0
+    
+    values = [
+        _build_page_test(run_id, url, result, artifact_path).model_dump(exclude={"id"})
+        for url, result, artifact_path in rows
+    ]
+    
+    # Core insert with a parameter list -> one executemany, one commit (no ORM unit-of-work)
+    with engine.begin() as conn:
+        conn.execute(PageTest.__table__.insert(), values)
+    
+    return len(rows)
+
+
+def _build_page_test(run_id: str, url: str, result: dict, artifact_path: Optional[str] = None) -> PageTest:
+    """Map a smoke test result dictionary onto a summary-only PageTest row."""
     assertions = result.get('assertions', [])
     assertions_passed = sum(1 for a in assertions if a.get('pass'))
     
-    page_test = PageTest(
+    return PageTest(
         run_id=run_id,
         url=url,
         status=result.get('status', 'UNKNOWN'),
@@ -145,15 +209,8 @@ def create_page_test(
         assertions_total=len(assertions),
         forms_found=result.get('forms_found', 0),
         screenshot_path=result.get('screenshot'),
-        result_json=json.dumps(result)
+        artifact_path=artifact_path
     )
-    
-    with get_session() as session:
-        session.add(page_test)
-        session.commit()
-        session.refresh(page_test)
-    
-    return page_test
 
 
 def get_test_run(run_id: str) -> Optional[TestRun]:
@@ -171,8 +228,8 @@ def get_recent_runs(limit: int = 10) -> List[TestRun]:
 
 
 def get_page_tests(run_id: str) -> List[PageTest]:
-    """Get all page tests for a run."""
+    """Get all page tests for a run, in the order they were stored."""
     with get_session() as session:
-        statement = select(PageTest).where(PageTest.run_id == run_id)
+        statement = select(PageTest).where(PageTest.run_id == run_id).order_by(PageTest.id)
         return list(session.exec(statement))
 
@@ -1,7 +1,7 @@
 """Web crawler for discovering pages to test."""
 
 from urllib.parse import urljoin, urlparse
-from typing import Set, List, Optional, Dict, Any
+from typing import Set, List, Optional, Dict, Any, Pattern, Union
 import requests
 from bs4 import BeautifulSoup
 import re
@@ -13,13 +13,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _compile_patterns(patterns: Optional[List[Union[str, Pattern]]]) -> List[Pattern]:
+    """Compile regex patterns sekali sebelum loop crawl (pattern yang sudah di-compile dipakai apa adanya)."""
+    return [re.compile(pattern) for pattern in patterns or []]
+
+
 def crawl_site(
     base_url: str,
     max_depth: int = 2,
     max_pages: int = 50,
     same_origin_only: bool = True,
-    include_patterns: Optional[List[str]] = None,
-    exclude_patterns: Optional[List[str]] = None,
+    include_patterns: Optional[List[Union[str, Pattern]]] = None,
+    exclude_patterns: Optional[List[Union[str, Pattern]]] = None,
     timeout: int = 10,
     auth: Optional[Dict[str, Any]] = None
 ) -> List[str]:
@@ -31,8 +36,8 @@ def crawl_site(
         max_depth: Kedalaman maksimal crawling (default: 2)
         max_pages: Jumlah halaman maksimal yang akan di-crawl (default: 50)
         same_origin_only: Hanya crawl same-origin URLs (default: True)
-        include_patterns: List regex patterns untuk include URLs
-        exclude_patterns: List regex patterns untuk exclude URLs
+        include_patterns: List regex patterns (str atau re.Pattern) untuk include URLs
+        exclude_patterns: List regex patterns (str atau re.Pattern) untuk exclude URLs
         timeout: Request timeout dalam detik (default: 10)
         auth: Authentication configuration untuk login (optional)
         
@@ -42,6 +47,8 @@ def crawl_site(
     visited: Set[str] = set()
     to_visit: List[tuple] = [(base_url, 0)]  # (url, depth)
     found_urls: List[str] = []
+    include_res = _compile_patterns(include_patterns)
+    exclude_res = _compile_patterns(exclude_patterns)
     
     # Parse base domain
     base_parsed = urlparse(base_url)
@@ -58,14 +65,14 @@ def crawl_site(
             continue
         
         # Check include patterns
-        if include_patterns:
-            if not any(re.search(pattern, current_url) for pattern in include_patterns):
+        if include_res:
+            if not any(pattern.search(current_url) for pattern in include_res):
                 logger.debug(f"Skipping {current_url} - doesn't match include patterns")
                 continue
         
         # Check exclude patterns
-        if exclude_patterns:
-            if any(re.search(pattern, current_url) for pattern in exclude_patterns):
+        if exclude_res:
+            if any(pattern.search(current_url) for pattern in exclude_res):
                 logger.debug(f"Skipping {current_url} - matches exclude pattern")
                 continue
         
@@ -137,8 +144,8 @@ def crawl_site_with_auth(
     max_depth: int = 2,
     max_pages: int = 50,
     same_origin_only: bool = True,
-    include_patterns: Optional[List[str]] = None,
-    exclude_patterns: Optional[List[str]] = None,
+    include_patterns: Optional[List[Union[str, Pattern]]] = None,
+    exclude_patterns: Optional[List[Union[str, Pattern]]] = None,
     timeout: int = 10,
     auth: Optional[Dict[str, Any]] = None,
     headless: bool = True
@@ -151,8 +158,8 @@ def crawl_site_with_auth(
         max_depth: Kedalaman maksimal crawling (default: 2)
         max_pages: Jumlah halaman maksimal yang akan di-crawl (default: 50)
         same_origin_only: Hanya crawl same-origin URLs (default: True)
-        include_patterns: List regex patterns untuk include URLs
-        exclude_patterns: List regex patterns untuk exclude URLs
+        include_patterns: List regex patterns (str atau re.Pattern) untuk include URLs
+        exclude_patterns: List regex patterns (str atau re.Pattern) untuk exclude URLs
         timeout: Request timeout dalam detik (default: 10)
         auth: Authentication configuration untuk login (optional)
         headless: Run browser in headless mode (default: True)
@@ -163,6 +170,8 @@ def crawl_site_with_auth(
     visited: Set[str] = set()
     to_visit: List[tuple] = [(base_url, 0)]  # (url, depth)
     found_urls: List[str] = []
+    include_res = _compile_patterns(include_patterns)
+    exclude_res = _compile_patterns(exclude_patterns)
     
     # Parse base domain
     base_parsed = urlparse(base_url)
@@ -217,14 +226,14 @@ def crawl_site_with_auth(
                     continue
                 
                 # Check include patterns
-                if include_patterns:
-                    if not any(re.search(pattern, current_url) for pattern in include_patterns):
+                if include_res:
+                    if not any(pattern.search(current_url) for pattern in include_res):
                         logger.debug(f"Skipping {current_url} - doesn't match include patterns")
                         continue
                 
                 # Check exclude patterns
-                if exclude_patterns:
-                    if any(re.search(pattern, current_url) for pattern in exclude_patterns):
+                if exclude_res:
+                    if any(pattern.search(current_url) for pattern in exclude_res):
                         logger.debug(f"Skipping {current_url} - matches exclude pattern")
                         continue
                 
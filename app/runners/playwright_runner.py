@@ -3,17 +3,21 @@
 import sys
 import os
 import time
+import asyncio
 import json
+import gzip
+import base64
 import logging
+from contextlib import contextmanager, ExitStack
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 # Set event loop policy for Windows BEFORE importing Playwright
 # This is handled in main.py, no need to re-apply here
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from .component_tester import run_comprehensive_component_test
-from app.services.heuristics import perform_login
+from app.services.heuristics import perform_login, test_form_submission
 from app.services.xss_pentest import XSSPentester
 from app.services.sql_pentest import SQLPentester
 
@@ -21,6 +25,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 10000
+# Nama file hasil lengkap per halaman (JSON terkompresi gzip)
+RESULT_FILENAME = "result.json.gz"
+DEFAULT_SCREENSHOT_QUALITY = 60
+# Jumlah browser worker default untuk browser pool halaman.
+# Setiap worker = satu proses Chromium, jadi dijaga tetap kecil.
+DEFAULT_PAGE_CONCURRENCY = 4
 
 
 def clean_for_json(data):
@@ -50,6 +60,85 @@ def clean_for_json(data):
         return data
 
 
+def _capture_screenshot(
+    context: BrowserContext,
+    page: Page,
+    path: str,
+    full_page: bool = False,
+    quality: int = DEFAULT_SCREENSHOT_QUALITY
+) -> None:
+    """
+    Simpan screenshot JPEG halaman.
+    
+    Viewport-only memakai CDP Page.captureScreenshot langsung (lebih ringan dari
+    page.screenshot); full-page dan browser non-Chromium memakai page.screenshot.
+    
+    Args:
+        context: BrowserContext pemilik page
+        page: Halaman yang di-screenshot
+        path: Path file output (.jpg)
+        full_page: Screenshot seluruh halaman (default: False)
+        quality: Kualitas JPEG 1-100
+    """
+    if not full_page:
+        try:
+            cdp = context.new_cdp_session(page)
+            try:
+                data = cdp.send("Page.captureScreenshot", {
+                    "format": "jpeg",
+                    "quality": quality,
+                    "captureBeyondViewport": False
+                })
+            finally:
+                cdp.detach()
+            with open(path, 'wb') as f:
+                f.write(base64.b64decode(data["data"]))
+            return
+        except Exception as e:
+            logger.debug(f"CDP screenshot unavailable, falling back: {e}")
+    
+    page.screenshot(path=path, type="jpeg", quality=quality, full_page=full_page)
+
+
+@contextmanager
+def browser_session(headless: bool = True) -> Iterator[Browser]:
+    """
+    Buka satu Playwright driver + Chromium untuk dipakai ulang banyak halaman.
+    
+    Args:
+        headless: Run browser in headless mode (default: True)
+        
+    Yields:
+        Browser yang sudah di-launch; ditutup otomatis saat keluar dari blok
+    """
+    p = _start_playwright()
+    try:
+        browser = p.chromium.launch(headless=headless)
+        try:
+            yield browser
+        finally:
+            browser.close()
+    finally:
+        p.stop()
+
+
+def _start_playwright():
+    """
+    Start the Playwright driver, falling back to Proactor if winloop can't spawn it.
+    
+    winloop (installed by main.py when available) does not support the
+    ``startupinfo`` argument Playwright passes when spawning its driver on Windows.
+    """
+    try:
+        return sync_playwright().start()
+    except Exception as e:
+        if sys.platform != 'win32' or 'startupinfo' not in str(e):
+            raise
+        logger.warning(f"winloop cannot start the Playwright driver ({e}); falling back to ProactorEventLoop")
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        return sync_playwright().start()
+
+
 def run_page_smoke(
     url: str,
     out_dir: str,
@@ -60,7 +149,10 @@ def run_page_smoke(
     form_safe_mode: bool = True,
     auth: Optional[Dict[str, Any]] = None,
     enable_xss_test: bool = False,
-    enable_sql_test: bool = False
+    enable_sql_test: bool = False,
+    browser: Optional[Browser] = None,
+    full_page_screenshot: bool = False,
+    screenshot_quality: int = DEFAULT_SCREENSHOT_QUALITY
 ) -> Dict[str, Any]:
     """
     Jalankan smoke test pada satu halaman.
@@ -74,11 +166,18 @@ def run_page_smoke(
         test_forms: Test form submission (default: False)
         form_safe_mode: Use safe mode for form testing to avoid session loss (default: True)
         auth: Authentication configuration (optional)
+        browser: Browser yang sudah berjalan (optional). Jika diberikan, halaman
+            dibuka di context baru pada browser ini dan hanya context yang ditutup;
+            jika tidak, Playwright + Chromium di-launch khusus untuk halaman ini.
+        full_page_screenshot: Screenshot seluruh halaman, bukan hanya viewport (default: False)
+        screenshot_quality: Kualitas JPEG screenshot 1-100 (default: 60)
         
     Returns:
         Dictionary berisi hasil test lengkap
     """
-    os.makedirs(out_dir, exist_ok=True)
+    # Caller biasanya sudah membuat out_dir; cukup satu stat dalam kasus itu
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir, exist_ok=True)
     
     result = {
         "url": url,
@@ -96,12 +195,14 @@ def run_page_smoke(
     }
     
     try:
-        with sync_playwright() as p:
-            browser: Browser = p.chromium.launch(headless=headless)
+        with ExitStack() as stack:
+            if browser is None:
+                browser = stack.enter_context(browser_session(headless))
             context: BrowserContext = browser.new_context(
                 ignore_https_errors=True,
                 user_agent=os.getenv("USER_AGENT", "Mozilla/5.0 (compatible; BlackBoxTester/1.0)")
             )
+            stack.callback(context.close)
             page: Page = context.new_page()
             page.set_default_timeout(timeout)
 
@@ -295,13 +396,12 @@ def run_page_smoke(
                 
                 # Save detailed component report
                 component_report_path = os.path.join(out_dir, "component_test.json")
-                with open(component_report_path, 'w', encoding='utf-8') as f:
-                    json.dump(component_results, f, indent=2, ensure_ascii=False)
+                with open(component_report_path, 'wb') as f:
+                    f.write(json.dumps(component_results, indent=2, ensure_ascii=False).encode('utf-8'))
             
             # Form Testing (jika diaktifkan dan ada form)
             if test_forms and result.get('forms_found', 0) > 0:
                 try:
-                    from app.services.heuristics import test_form_submission
                     logger.info(f"Testing form submission for: {url}")
                     
                     # Use safe mode to avoid session loss
@@ -350,8 +450,8 @@ def run_page_smoke(
                     result['pentest_error'] = str(e)
 
             # Screenshot
-            screenshot_path = os.path.join(out_dir, "screenshot.png")
-            page.screenshot(path=screenshot_path, full_page=True)
+            screenshot_path = os.path.join(out_dir, "screenshot.jpg")
+            _capture_screenshot(context, page, screenshot_path, full_page_screenshot, screenshot_quality)
             result["screenshot"] = screenshot_path
             
             # Save page HTML
@@ -372,9 +472,6 @@ def run_page_smoke(
                             f.write("")
             
             logger.info(f"✓ Test complete: {url} - {result['status']}")
-
-            context.close()
-            browser.close()
     
     except Exception as e:
         import traceback
@@ -384,22 +481,147 @@ def run_page_smoke(
         logger.error(f"✗ Error testing {url}: {type(e).__name__}")
         logger.error(f"Full traceback:\n{error_detail}")
     
-    # Save result as JSON (clean data first)
-    result_path = os.path.join(out_dir, "result.json")
+    # Save result as gzip-compressed JSON (clean data first)
+    result_path = os.path.join(out_dir, RESULT_FILENAME)
     cleaned_result = clean_for_json(result)
-    with open(result_path, 'w', encoding='utf-8') as f:
-        json.dump(cleaned_result, f, indent=2, ensure_ascii=False)
+    # Serialize first so gzip gets one write instead of one per JSON token
+    with gzip.open(result_path, 'wb') as f:
+        f.write(json.dumps(cleaned_result, indent=2, ensure_ascii=False).encode('utf-8'))
     
     return result
 
 
+def run_page_smoke_fast(
+    url: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    headless: bool = True,
+    auth: Optional[Dict[str, Any]] = None,
+    browser: Optional[Browser] = None
+) -> Dict[str, Any]:
+    """
+    Versi ringan run_page_smoke untuk cek cepat satu halaman.
+    
+    Hanya load halaman, HTTP status, console/network errors, dan assertion
+    dasar (title, h1, charset, lang). Tanpa deep component test, form test,
+    pentest, screenshot, maupun file artifacts.
+    
+    Args:
+        url: URL halaman yang akan ditest
+        timeout: Timeout dalam ms (default: 10000)
+        headless: Run browser in headless mode (default: True)
+        auth: Authentication configuration (optional)
+        browser: Browser yang sudah berjalan (optional), lihat run_page_smoke
+        
+    Returns:
+        Dictionary hasil test dengan bentuk yang sama seperti run_page_smoke
+    """
+    result = {
+        "url": url,
+        "status": "UNKNOWN",
+        "load_ms": None,
+        "console_errors": [],
+        "console_warnings": [],
+        "network_failures": [],
+        "assertions": [],
+        "forms_found": 0,
+        "forms_tested": 0,
+        "screenshot": None,
+        "timestamp": datetime.now().isoformat(),
+        "error": None
+    }
+    
+    try:
+        with ExitStack() as stack:
+            if browser is None:
+                browser = stack.enter_context(browser_session(headless))
+            context = browser.new_context(
+                ignore_https_errors=True,
+                user_agent=os.getenv("USER_AGENT", "Mozilla/5.0 (compatible; BlackBoxTester/1.0)")
+            )
+            stack.callback(context.close)
+            page = context.new_page()
+            page.set_default_timeout(timeout)
+            
+            def handle_console(msg):
+                if msg.type == "error":
+                    result["console_errors"].append({"text": msg.text, "type": msg.type, "location": msg.location})
+                elif msg.type == "warning":
+                    result["console_warnings"].append(msg.text)
+            
+            page.on("console", handle_console)
+            page.on("requestfailed", lambda req: result["network_failures"].append({
+                "url": req.url,
+                "method": req.method,
+                "resource_type": req.resource_type,
+                "failure": req.failure,
+            }))
+            
+            if auth and auth.get("enabled"):
+                creds = auth.get("credentials", {}) or {}
+                result["auth"] = perform_login(
+                    page=page,
+                    login_url=auth.get("url") or url,
+                    username=creds.get("username") or creds.get("email") or "",
+                    password=creds.get("password") or "",
+                    success_indicator=auth.get("success_indicator"),
+                    timeout_ms=timeout,
+                )
+            
+            t0 = time.time()
+            resp = page.goto(url, wait_until="load", timeout=timeout)
+            result["load_ms"] = int((time.time() - t0) * 1000)
+            
+            code = resp.status if resp else None
+            result["http_status"] = code
+            result["status"] = "PASS" if code and 200 <= code < 400 else f"HTTP_{code}"
+            
+            # Semua assertion dasar dalam satu round-trip ke browser
+            checks = page.evaluate("""() => ({
+                title: document.title,
+                h1: document.querySelectorAll('h1').length,
+                charset: !!document.querySelector('meta[charset], meta[http-equiv="Content-Type"]'),
+                lang: document.documentElement.hasAttribute('lang'),
+                forms: document.forms.length
+            })""")
+            title = checks["title"] or ""
+            result["forms_found"] = checks["forms"]
+            result["assertions"] = [
+                {"assert": "title_not_empty", "pass": bool(title.strip()), "actual": title, "expected": "non-empty string"},
+                {"assert": "has_h1", "pass": checks["h1"] > 0, "count": checks["h1"], "expected": "at least 1"},
+                {"assert": "has_meta_charset", "pass": checks["charset"], "actual": "found" if checks["charset"] else "not found"},
+                {"assert": "has_html_lang", "pass": checks["lang"], "actual": "found" if checks["lang"] else "not found"},
+            ]
+    
+    except Exception as e:
+        result["status"] = "ERROR"
+        result["error"] = f"{type(e).__name__}: {str(e)}"
+        logger.error(f"✗ Error testing {url}: {type(e).__name__}")
+    
+    return result
+
+
+def load_page_result(out_dir: str) -> Dict[str, Any]:
+    """
+    Baca hasil lengkap halaman dari artifact dir (untuk drill-down lazy).
+    
+    Args:
+        out_dir: Direktori artifacts halaman (PageTest.artifact_path)
+        
+    Returns:
+        Dictionary hasil test seperti yang dikembalikan run_page_smoke
+    """
+    with gzip.open(os.path.join(out_dir, RESULT_FILENAME), 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def run_yaml_scenario(
     scenario: Dict[str, Any],
     base_url: str,
     out_dir: str,
     timeout: int = DEFAULT_TIMEOUT,
     headless: bool = True,
-    auth: Optional[Dict[str, Any]] = None
+    auth: Optional[Dict[str, Any]] = None,
+    browser: Optional[Browser] = None
 ) -> Dict[str, Any]:
     """
     Jalankan skenario test dari YAML spec.
@@ -410,6 +632,7 @@ def run_yaml_scenario(
         out_dir: Direktori untuk artifacts
         timeout: Timeout dalam ms
         headless: Run in headless mode
+        browser: Browser yang sudah berjalan (optional), lihat run_page_smoke
         
     Returns:
         Dictionary hasil eksekusi
@@ -427,9 +650,11 @@ def run_yaml_scenario(
     }
     
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=headless)
+        with ExitStack() as stack:
+            if browser is None:
+                browser = stack.enter_context(browser_session(headless))
             context = browser.new_context(ignore_https_errors=True)
+            stack.callback(context.close)
             page = context.new_page()
             page.set_default_timeout(timeout)
             
@@ -549,9 +774,6 @@ def run_yaml_scenario(
                         result["screenshots"].append(error_screenshot)
                     except:
                         pass
-            
-            context.close()
-            browser.close()
     
     except Exception as e:
         result["errors"].append({
@@ -562,8 +784,24 @@ def run_yaml_scenario(
     
     # Save result
     result_path = os.path.join(out_dir, "scenario_result.json")
-    with open(result_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    with open(result_path, 'wb') as f:
+        f.write(json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8'))
     
     return result
 
+
+
+def run_scenario_worker(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Entry point ProcessPoolExecutor untuk satu skenario YAML.
+    
+    Didefinisikan di level modul agar bisa di-pickle; setiap proses worker
+    menjalankan sync_playwright() miliknya sendiri lewat run_yaml_scenario.
+    
+    Args:
+        job: Keyword arguments untuk run_yaml_scenario
+        
+    Returns:
+        Dictionary hasil eksekusi
+    """
+    return run_yaml_scenario(**job)
@@ -0,0 +1,159 @@
+"""
+Pool browser Playwright yang hidup lintas rerun Streamlit.
+
+Playwright sync API terikat ke thread yang membuatnya, sedangkan Streamlit
+menjalankan setiap rerun di thread baru. Karena itu browser tidak disimpan
+langsung di cache, melainkan dimiliki oleh worker thread berumur panjang;
+pekerjaan dikirim ke worker lewat antrian dan hasilnya kembali sebagai Future.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack
+from typing import Any, Callable, List, Optional
+
+from app.runners.playwright_runner import DEFAULT_PAGE_CONCURRENCY, browser_session
+
+logger = logging.getLogger(__name__)
+
+# Import streamlit untuk cache_resource
+try:
+    import streamlit as st
+except ImportError:
+    st = None
+
+_STOP = object()
+_pools: List["BrowserPool"] = []
+_pools_lock = threading.Lock()
+
+
+class BrowserPool:
+    """Worker thread berumur panjang, masing-masing memiliki satu Chromium."""
+    
+    def __init__(self, size: int = DEFAULT_PAGE_CONCURRENCY, headless: bool = True):
+        self.size = max(1, size)
+        self.headless = headless
+        self._jobs: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"browser-pool-{i}", daemon=True)
+            for i in range(self.size)
+        ]
+        for t in self._threads:
+            t.start()
+        
+        with _pools_lock:
+            _pools.append(self)
+        logger.info(f"Browser pool started: {self.size} workers, headless={headless}")
+    
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Jalankan fn(*args, browser=<browser worker>, **kwargs) di salah satu worker.
+        
+        Args:
+            fn: Fungsi runner yang menerima parameter browser (mis. run_page_smoke)
+            *args: Positional arguments untuk fn
+            **kwargs: Keyword arguments untuk fn
+            
+        Returns:
+            Future berisi hasil fn
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        
+        future: Future = Future()
+        self._jobs.put((future, fn, args, kwargs))
+        return future
+    
+    def close(self, timeout: Optional[float] = 10) -> None:
+        """Hentikan semua worker; setiap worker menutup browsernya sendiri."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(_STOP)
+        for t in self._threads:
+            t.join(timeout)
+        
+        with _pools_lock:
+            if self in _pools:
+                _pools.remove(self)
+        logger.info("Browser pool closed")
+    
+    def _worker(self) -> None:
+        stack = ExitStack()
+        browser = None
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is _STOP:
+                    return
+                future, fn, args, kwargs = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                
+                try:
+                    # (Re)launch lazily: first job, or after the browser crashed
+                    if browser is None or not browser.is_connected():
+                        stack.close()
+                        browser = None
+                        try:
+                            browser = stack.enter_context(browser_session(self.headless))
+                        except Exception as e:
+                            # Runner launches its own browser, so a launch failure becomes
+                            # that job's ERROR result instead of aborting the whole run
+                            logger.error(f"Browser launch failed, running job without pooled browser: {e}")
+                    future.set_result(fn(*args, browser=browser, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            try:
+                stack.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {e}")
+
+
+def shutdown_browser_pools() -> None:
+    """Tutup semua pool yang masih hidup (dipakai atexit dan tombol restart)."""
+    with _pools_lock:
+        pools = list(_pools)
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(shutdown_browser_pools)
+
+
+def _create_pool(headless: bool, size: int) -> BrowserPool:
+    """Buat pool baru; pool lama dengan mode headless yang sama ditutup (satu pool per mode)."""
+    with _pools_lock:
+        stale = [pool for pool in _pools if pool.headless == headless]
+    for pool in stale:
+        pool.close()
+    return BrowserPool(size=size, headless=headless)
+
+
+if st is not None:
+    _create_pool = st.cache_resource(max_entries=2, show_spinner=False)(_create_pool)
+
+
+def get_browser_pool(headless: bool = True, size: int = DEFAULT_PAGE_CONCURRENCY) -> BrowserPool:
+    """
+    Ambil browser pool bersama untuk mode headless dan jumlah worker tertentu.
+    
+    Args:
+        headless: Run browser in headless mode
+        size: Jumlah worker (browser) yang menjalankan halaman secara paralel
+        
+    Returns:
+        BrowserPool yang di-cache lintas rerun dan session (jika Streamlit tersedia)
+    """
+    pool = _create_pool(headless, size)
+    if pool._closed and st is not None:
+        # Cached pool was replaced by another size or shut down via restart
+        _create_pool.clear()
+        pool = _create_pool(headless, size)
+    return pool
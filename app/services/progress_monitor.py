@@ -167,8 +167,9 @@ class StreamlitProgressUpdater:
         self.progress_bar = progress_bar
         self.status_text = status_text
         self.metrics_container = metrics_container
-        self.chart_data = []
         self.last_update_time = 0
+        # Last values sent to the browser; unchanged ticks skip the UI writes
+        self._last_rendered = None
         
     async def update_progress(self, data: Dict[str, Any]):
         """Update Streamlit UI dengan progress data."""
@@ -179,27 +180,23 @@ class StreamlitProgressUpdater:
                 return
             self.last_update_time = current_time
             
-            # Update progress bar
             progress_value = min(1.0, max(0.0, data['progress_percent'] / 100))
-            self.progress_bar.progress(progress_value)
             
-            # Update status text with more detailed info
+            # Status text with more detailed info
             status_msg = f"🔄 Running... {data['progress_percent']:.1f}% | "
             status_msg += f"Active: {data['active_users']} | "
             status_msg += f"RPS: {data['current_rps']:.1f} | "
             status_msg += f"Success: {data['success_rate']:.1f}% | "
             status_msg += f"Completed: {data['completed_requests']:,}"
-            self.status_text.text(status_msg)
             
-            # Store chart data for later visualization (no UI updates here)
-            self.chart_data.append({
-                'Time (s)': len(self.chart_data),
-                'RPS': data['current_rps'],
-                'Success Rate (%)': data['success_rate'],
-                'Active Users': data['active_users'],
-                'Progress (%)': data['progress_percent'],
-                'Completed Requests': data['completed_requests']
-            })
+            # Skip re-sending the same bar/text (e.g. while the test idles in ramp-down)
+            rendered = (int(progress_value * 100), status_msg)
+            if rendered == self._last_rendered:
+                return
+            self._last_rendered = rendered
+            
+            self.progress_bar.progress(progress_value)
+            self.status_text.text(status_msg)
             
         except Exception as e:
             logger.error(f"Error updating Streamlit progress: {e}")
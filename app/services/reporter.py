@@ -2,11 +2,19 @@
 
 from jinja2 import Template
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import json
 import csv
 from datetime import datetime
 import os
 
+# orjson is optional; it serializes the (large) JSON report several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -428,8 +436,21 @@ def generate_json_report(
         "results": results
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    _write_json(report, output_path)
+
+
+def _write_json(data: Any, output_path: str) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when it can handle the payload."""
+    if orjson is not None:
+        try:
+            Path(output_path).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+            return
+        except TypeError:
+            pass  # e.g. unsupported types or >64-bit ints; stdlib handles/reports these
+    
+    Path(output_path).write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
 
 
 def generate_all_reports(
@@ -454,9 +475,15 @@ def generate_all_reports(
     csv_path = os.path.join(output_dir, "report.csv")
     json_path = os.path.join(output_dir, "report.json")
     
-    generate_html_report(results, html_path, run_id)
-    generate_csv_report(results, csv_path)
-    generate_json_report(results, json_path, run_id)
+    # The three formats are independent; render/serialize/write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(generate_html_report, results, html_path, run_id),
+            executor.submit(generate_csv_report, results, csv_path),
+            executor.submit(generate_json_report, results, json_path, run_id),
+        ]
+        for future in futures:
+            future.result()
     
     return {
         "html": html_path,
@@ -809,8 +836,7 @@ def generate_stress_test_reports(
     generate_stress_test_csv_report(stress_results, csv_path)
     
     # Save JSON results
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(stress_results, f, indent=2, ensure_ascii=False)
+    _write_json(stress_results, json_path)
     
     return {
         "html": html_path,
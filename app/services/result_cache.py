@@ -0,0 +1,134 @@
+"""Persistent disk cache for smoke-test results, keyed by URL + test options."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# diskcache is optional; without it every page is tested fresh
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+CACHE_DIR = os.getenv("SMOKE_CACHE_DIR", ".cache/smoke")
+DEFAULT_TTL = 3600  # seconds
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache():
+    """Open the disk cache once; returns None if diskcache isn't installed."""
+    global _cache
+    if diskcache is None:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(CACHE_DIR)
+        return _cache
+
+
+def result_cache_key(url: str, **options: Any) -> str:
+    """
+    Build a cache key for a page test.
+    
+    Args:
+        url: Page URL
+        **options: Test options that change the result (headless, timeout, ...)
+        
+    Returns:
+        Hex digest identifying the URL + options combination
+    """
+    payload = json.dumps([url, options], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached page test entry.
+    
+    Args:
+        key: Key from result_cache_key
+        
+    Returns:
+        Dict with 'result' and 'artifact_path', or None on miss
+    """
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Result cache read failed: {e}")
+        return None
+
+
+def store_result(key: str, result: Dict[str, Any], artifact_path: Optional[str] = None, expire: int = DEFAULT_TTL) -> None:
+    """
+    Cache a page test result; errored results are never cached.
+    
+    Args:
+        key: Key from result_cache_key
+        result: Result dictionary from run_page_smoke
+        artifact_path: Page artifact directory of the run that produced it
+        expire: Time-to-live in seconds
+    """
+    cache = _get_cache()
+    if cache is None or result.get("status") == "ERROR":
+        return
+    try:
+        cache.set(key, {"result": result, "artifact_path": artifact_path}, expire=expire)
+    except Exception as e:
+        logger.warning(f"Result cache write failed: {e}")
+
+
+def restore_cached_artifacts(entry: Dict[str, Any], out_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Bring a cached page result into the current run.
+    
+    The cached page's artifact directory is hard-linked (or copied) to out_dir, so
+    the new run never points into another run's directory.
+    
+    Args:
+        entry: Entry from get_cached_result
+        out_dir: Page artifact directory of the current run (must not exist yet)
+        
+    Returns:
+        The cached result with its file paths moved to out_dir, or None if the
+        cached artifacts no longer exist (treat as a cache miss)
+    """
+    src = entry.get("artifact_path")
+    if not src or not os.path.isdir(src):
+        return None
+    try:
+        shutil.copytree(src, out_dir, copy_function=_link_or_copy)
+    except OSError as e:
+        logger.warning(f"Cannot reuse cached artifacts from {src}: {e}")
+        shutil.rmtree(out_dir, ignore_errors=True)
+        return None
+    return _rebase_paths(entry["result"], src, out_dir)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a file (instant, no extra space); copy when linking isn't possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _rebase_paths(data: Any, old_dir: str, new_dir: str) -> Any:
+    """Rewrite every path under old_dir in a result dictionary to live under new_dir."""
+    if isinstance(data, dict):
+        return {key: _rebase_paths(value, old_dir, new_dir) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_rebase_paths(value, old_dir, new_dir) for value in data]
+    if isinstance(data, str) and (data == old_dir or data.startswith(old_dir + os.sep)):
+        return new_dir + data[len(old_dir):]
+    return data
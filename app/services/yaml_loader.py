@@ -4,9 +4,15 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic import field_validator, model_validator
 from pydantic.config import ConfigDict
-from typing import List, Dict, Any, Optional, Union
+from typing import IO, List, Dict, Any, Optional, Union
 import os
 
+# Pakai libyaml (C) bila tersedia; fallback ke loader pure-Python
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class YAMLStep(BaseModel):
     """Single test step in a YAML scenario."""
@@ -83,12 +89,13 @@ class YAMLTestSpec(BaseModel):
         return v
 
 
-def load_yaml_spec(file_path: str) -> YAMLTestSpec:
+def load_yaml_spec(file_path: Union[str, IO]) -> YAMLTestSpec:
     """
     Load and validate YAML test specification.
     
     Args:
-        file_path: Path to YAML file
+        file_path: Path to YAML file, or an open (text/binary) stream such as
+            an uploaded file, which is parsed directly without a temp copy
         
     Returns:
         Validated YAMLTestSpec object
@@ -97,11 +104,14 @@ def load_yaml_spec(file_path: str) -> YAMLTestSpec:
         FileNotFoundError: If file doesn't exist
         ValueError: If YAML is invalid
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"YAML file not found: {file_path}")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    if hasattr(file_path, 'read'):
+        data = yaml.load(file_path, Loader=SafeLoader)
+    else:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"YAML file not found: {file_path}")
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=SafeLoader)
     
     try:
         spec = YAMLTestSpec(**data)
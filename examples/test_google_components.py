@@ -116,7 +116,7 @@ def main():
     print("=" * 60)
     print(f"📸 Screenshot: {result.get('screenshot', 'N/A')}")
     print(f"📄 Component Details: {output_dir}/component_test.json")
-    print(f"🔍 Full Result: {output_dir}/result.json")
+    print(f"🔍 Full Result: {output_dir}/result.json.gz")
     print()
     
     # Save summary
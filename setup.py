@@ -17,6 +17,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/webuniversal-blackbox-test",
     packages=find_packages(),
+    package_data={"app": ["static/*"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -0,0 +1,89 @@
+"""Unit tests for the shared browser pool."""
+
+import threading
+from contextlib import contextmanager
+
+from app.services import browser_pool
+from app.services.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    """Minimal stand-in for a Playwright Browser."""
+    
+    def __init__(self):
+        self.thread = threading.current_thread().name
+        self.closed = False
+    
+    def is_connected(self):
+        return not self.closed
+
+
+def test_browser_pool_reuses_worker_browser(monkeypatch):
+    """Test that jobs run on the worker thread with that worker's browser."""
+    launched = []
+    
+    @contextmanager
+    def fake_session(headless=True):
+        browser = FakeBrowser()
+        launched.append(browser)
+        try:
+            yield browser
+        finally:
+            browser.closed = True
+    
+    monkeypatch.setattr(browser_pool, "browser_session", fake_session)
+    
+    def job(value, browser=None):
+        return value, browser, threading.current_thread().name
+    
+    pool = BrowserPool(size=1)
+    try:
+        results = [pool.submit(job, i).result(timeout=5) for i in range(3)]
+    finally:
+        pool.close()
+    
+    assert [r[0] for r in results] == [0, 1, 2]
+    assert len(launched) == 1
+    assert all(r[1] is launched[0] for r in results)
+    assert launched[0].thread == results[0][2]
+    assert launched[0].closed
+
+
+def test_get_browser_pool_replaces_pool_on_resize():
+    """Test that resizing closes the old pool and a closed cached pool is rebuilt."""
+    small = browser_pool.get_browser_pool(headless=True, size=1)
+    try:
+        assert browser_pool.get_browser_pool(headless=True, size=1) is small
+        
+        large = browser_pool.get_browser_pool(headless=True, size=2)
+        assert large.size == 2
+        assert small._closed
+        
+        again = browser_pool.get_browser_pool(headless=True, size=1)
+        assert again is not small
+        assert not again._closed
+        assert large._closed
+    finally:
+        browser_pool.shutdown_browser_pools()
+
+
+def test_browser_pool_runs_job_without_browser_when_launch_fails(monkeypatch):
+    """Test that a launch failure reaches the runner (browser=None) instead of failing the job."""
+    @contextmanager
+    def failing_session(headless=True):
+        raise RuntimeError("Executable doesn't exist")
+        yield
+    
+    monkeypatch.setattr(browser_pool, "browser_session", failing_session)
+    
+    def job(url, browser=None):
+        # Runners launch their own browser when none is passed and report errors in the result
+        return {"url": url, "status": "ERROR" if browser is None else "PASS"}
+    
+    pool = BrowserPool(size=1)
+    try:
+        results = [pool.submit(job, url).result(timeout=5) for url in ("a", "b")]
+    finally:
+        pool.close()
+    
+    assert [r["status"] for r in results] == ["ERROR", "ERROR"]
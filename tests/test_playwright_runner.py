@@ -85,3 +85,15 @@ def test_yaml_scenario_with_assertions():
         assert result["steps_executed"] == 2
         assert result["steps_failed"] == 0
 
+
+def test_load_page_result_reads_gzip_artifact():
+    """Test that the compressed page result round-trips through load_page_result."""
+    import gzip
+    import json
+    from app.runners.playwright_runner import RESULT_FILENAME, load_page_result
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with gzip.open(os.path.join(tmpdir, RESULT_FILENAME), 'wt', encoding='utf-8') as f:
+            json.dump({"url": "https://example.com", "status": "PASS"}, f)
+        
+        assert load_page_result(tmpdir) == {"url": "https://example.com", "status": "PASS"}
@@ -0,0 +1,48 @@
+"""Unit tests for the smoke-result cache helpers."""
+
+import os
+import tempfile
+
+from app.services.result_cache import restore_cached_artifacts
+
+
+def test_restore_cached_artifacts_moves_paths_into_new_run():
+    """Test that a cache hit gets its own copy of the artifacts and rewritten paths."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old_dir = os.path.join(tmpdir, "run_a", "page_0003")
+        new_dir = os.path.join(tmpdir, "run_b", "page_0000")
+        os.makedirs(old_dir)
+        os.makedirs(os.path.dirname(new_dir))
+        shot = os.path.join(old_dir, "screenshot.jpg")
+        with open(shot, "wb") as f:
+            f.write(b"jpeg")
+        
+        entry = {
+            "result": {
+                "url": "https://example.com",
+                "screenshot": shot,
+                "form_test": {"screenshot_before_path": shot},
+                "console_errors": [{"text": old_dir + "-not-a-child"}],
+            },
+            "artifact_path": old_dir,
+        }
+        result = restore_cached_artifacts(entry, new_dir)
+        
+        assert result["screenshot"] == os.path.join(new_dir, "screenshot.jpg")
+        assert result["form_test"]["screenshot_before_path"] == os.path.join(new_dir, "screenshot.jpg")
+        assert result["console_errors"][0]["text"] == old_dir + "-not-a-child"
+        assert entry["result"]["screenshot"] == shot
+        
+        # The new run keeps its artifacts when the old run is cleaned up
+        os.remove(shot)
+        with open(result["screenshot"], "rb") as f:
+            assert f.read() == b"jpeg"
+
+
+def test_restore_cached_artifacts_misses_when_artifacts_are_gone():
+    """Test that a cached entry whose artifact dir was deleted counts as a miss."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        entry = {"result": {"url": "https://example.com"}, "artifact_path": os.path.join(tmpdir, "gone")}
+        
+        assert restore_cached_artifacts(entry, os.path.join(tmpdir, "page_0000")) is None
+        assert not os.path.exists(os.path.join(tmpdir, "page_0000"))
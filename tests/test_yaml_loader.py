@@ -110,3 +110,15 @@ def test_yaml_auth_validation_valid():
     }
     spec = validate_yaml_spec(data)
     assert spec.auth and spec.auth.enabled is True
+
+
+def test_load_yaml_spec_from_stream():
+    """Test loading YAML spec directly from a binary stream."""
+    import io
+    
+    with open("tests/sample_specs/example.yaml", "rb") as f:
+        stream = io.BytesIO(f.read())
+    
+    spec = load_yaml_spec(stream)
+    assert spec.base_url.startswith("http")
+    assert len(spec.scenarios) > 0